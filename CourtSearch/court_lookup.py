@@ -9,12 +9,13 @@ Usage:
 
 Dependencies:
     - requests
-    - beautifulsoup4
+    - lxml
     - playwright
     - tabulate
     - python-dateutil
 """
 
+import calendar
 import re
 import sys
 from datetime import datetime
@@ -27,6 +28,9 @@ from scrapers import (
     CASE_AGE_LIMIT_YEARS,
 )
 
+# DOB input format: MM/DD/YYYY, with month/day/year captured
+_DOB_RE = re.compile(r"^(\d{2})/(\d{2})/(\d{4})$")
+
 
 def get_user_input() -> SearchCriteria:
     """
@@ -62,32 +66,28 @@ def get_user_input() -> SearchCriteria:
     dob = input("Enter Date of Birth MM/DD/YYYY (or press Enter to skip): ").strip()
     if dob:
         # Validate date format and actual date validity
-        if not re.match(r"^\d{2}/\d{2}/\d{4}$", dob):
+        m = _DOB_RE.match(dob)
+        if not m:
             print("Warning: Date format should be MM/DD/YYYY. Ignoring DOB filter.")
             dob = None
         else:
             # Validate the actual date values
-            try:
-                month, day, year = map(int, dob.split('/'))
-                # Check valid ranges
-                if not (1 <= month <= 12):
-                    print("Warning: Month must be between 01-12. Ignoring DOB filter.")
-                    dob = None
-                elif not (1 <= day <= 31):
-                    print("Warning: Day must be between 01-31. Ignoring DOB filter.")
-                    dob = None
-                elif not (1900 <= year <= datetime.now().year):
-                    print(f"Warning: Year must be between 1900-{datetime.now().year}. Ignoring DOB filter.")
-                    dob = None
-                else:
-                    # Additional validation for specific month/day combinations
-                    import calendar
-                    if day > calendar.monthrange(year, month)[1]:
-                        print(f"Warning: Invalid day {day} for month {month}. Ignoring DOB filter.")
-                        dob = None
-            except ValueError:
-                print("Warning: Invalid date format. Ignoring DOB filter.")
-            dob = None
+            month, day, year = map(int, m.groups())
+            current_year = datetime.now().year
+            # Check valid ranges
+            if not (1 <= month <= 12):
+                print("Warning: Month must be between 01-12. Ignoring DOB filter.")
+                dob = None
+            elif not (1 <= day <= 31):
+                print("Warning: Day must be between 01-31. Ignoring DOB filter.")
+                dob = None
+            elif not (1900 <= year <= current_year):
+                print(f"Warning: Year must be between 1900-{current_year}. Ignoring DOB filter.")
+                dob = None
+            elif day > calendar.monthrange(year, month)[1]:
+                # Additional validation for specific month/day combinations
+                print(f"Warning: Invalid day {day} for month {month}. Ignoring DOB filter.")
+                dob = None
     else:
         dob = None
 
@@ -130,9 +130,10 @@ def display_results(cases: list[CourtCase], criteria: SearchCriteria):
         print("  - The search requires authentication (registration may be needed)")
         return
 
-    # Count open vs closed cases
-    open_cases = [c for c in cases if c.status.upper() in ("OPEN", "ACTIVE", "PENDING")]
-    closed_cases = [c for c in cases if c not in open_cases]
+    # Partition open vs closed cases in a single pass
+    open_cases, closed_cases = [], []
+    for case in cases:
+        (open_cases if case.is_open else closed_cases).append(case)
 
     print("=" * 60)
     print("SEARCH RESULTS")
@@ -17,7 +17,18 @@ Usage:
     cases = scraper.search(criteria)
 """
 
-import time
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
+
+# orjson is optional - C-speed JSON encoding for API responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .base import (
     SearchCriteria,
@@ -26,6 +37,7 @@ from .base import (
     CountyScraper,
     CASE_AGE_LIMIT_YEARS,
     EXCLUDED_CASE_TYPES,
+    OPEN_STATUSES,
 )
 from .miami_dade import MiamiDadeScraper
 from .broward import BrowardScraper
@@ -45,11 +57,14 @@ __all__ = [
     "COUNTY_SCRAPERS",
     "get_scraper",
     "get_all_scrapers",
+    "reset_scraper_cache",
     "search_court_records",
     "get_api_response",
+    "get_api_response_bytes",
     # Constants
     "CASE_AGE_LIMIT_YEARS",
     "EXCLUDED_CASE_TYPES",
+    "OPEN_STATUSES",
 ]
 
 # Registry mapping county names to their scraper classes
@@ -59,11 +74,52 @@ COUNTY_SCRAPERS: dict[str, type[CountyScraper]] = {
     "new-york": NewYorkScraper,
 }
 
+# Long-lived statewide workers: sync Playwright browsers are pooled per thread
+# (see browser_pool.py), so keeping the threads alive reuses their browsers
+# across searches instead of relaunching Chromium every time.
+_search_executor = ThreadPoolExecutor(
+    max_workers=len(COUNTY_SCRAPERS),
+    thread_name_prefix="county-search",
+)
+
+# CourtCase fields exposed in API responses, in response order
+_API_CASE_FIELDS = (
+    "case_number",
+    "case_type",
+    "filing_date",
+    "status",
+    "county",
+    "parties",
+    "court_division",
+    "judge",
+    "amount",
+    "disposition_date",
+    "section",
+    "verification_instructions",
+    "search_results_url",
+)
+_get_api_case_fields = attrgetter(*_API_CASE_FIELDS)
+
+
+@lru_cache(maxsize=None)
+def _get_cached_scraper(county_key: str) -> CountyScraper:
+    """Instantiate a registered scraper once per process and reuse it."""
+    return COUNTY_SCRAPERS[county_key]()
+
+
+def reset_scraper_cache() -> None:
+    """Drop cached scraper instances (e.g. after changing COUNTY_SCRAPERS)."""
+    _get_cached_scraper.cache_clear()
+
 
 def get_scraper(county: str) -> CountyScraper:
     """
     Factory function to get the appropriate scraper for a county.
 
+    Scrapers hold no per-search state, so one instance per county is shared
+    process-wide; this keeps its HTTP session (and keep-alive connections)
+    warm across searches.
+
     Args:
         county: County name (case-insensitive)
 
@@ -82,7 +138,7 @@ def get_scraper(county: str) -> CountyScraper:
             f"Available counties: {available}"
         )
 
-    return COUNTY_SCRAPERS[county_key]()
+    return _get_cached_scraper(county_key)
 
 
 def get_all_scrapers() -> list[CountyScraper]:
@@ -93,14 +149,19 @@ def get_all_scrapers() -> list[CountyScraper]:
         List of CountyScraper instances
     """
     scrapers = []
-    for scraper_class in COUNTY_SCRAPERS.values():
+    for county_key in COUNTY_SCRAPERS:
         try:
-            scrapers.append(scraper_class())
+            scrapers.append(_get_cached_scraper(county_key))
         except Exception:
             pass  # Skip scrapers that fail to initialize
     return scrapers
 
 
+def _search_county(county_key: str, criteria: SearchCriteria) -> list[CourtCase]:
+    """Run a single county search with its shared scraper (worker thread body)."""
+    return _get_cached_scraper(county_key).search(criteria)
+
+
 def search_court_records(criteria: SearchCriteria) -> list[CourtCase]:
     """
     Execute court records search based on provided criteria.
@@ -111,7 +172,8 @@ def search_court_records(criteria: SearchCriteria) -> list[CourtCase]:
     Returns:
         Combined list of CourtCase objects from all searched counties
     """
-    all_cases = []
+    # One result list per county, flattened once at the end
+    per_county: list[list[CourtCase]] = []
 
     if criteria.county:
         # Search specific county
@@ -119,7 +181,7 @@ def search_court_records(criteria: SearchCriteria) -> list[CourtCase]:
         try:
             scraper = get_scraper(criteria.county)
             cases = scraper.search(criteria)
-            all_cases.extend(cases)
+            per_county.append(cases)
             print(f"  Found {len(cases)} case(s) in {scraper.county_name}")
         except ValueError as e:
             print(f"  Error: {e}")
@@ -132,16 +194,19 @@ def search_court_records(criteria: SearchCriteria) -> list[CourtCase]:
         print("\nPerforming statewide search...")
         print("(Note: Currently limited to implemented county scrapers)")
 
-        for county_name, scraper_class in COUNTY_SCRAPERS.items():
+        # Counties are independent and I/O-bound, so search them concurrently.
+        # Per-host politeness is handled by each scraper's REQUEST_DELAY.
+        futures = {
+            _search_executor.submit(_search_county, county_name, criteria): county_name
+            for county_name in COUNTY_SCRAPERS
+        }
+        for future in as_completed(futures):
+            county_name = futures[future]
+            print(f"\n  {county_name.title()} County:")
             try:
-                print(f"\n  Searching {county_name.title()} County...")
-                scraper = scraper_class()
-                cases = scraper.search(criteria)
-                all_cases.extend(cases)
+                cases = future.result()
+                per_county.append(cases)
                 print(f"    Found {len(cases)} case(s)")
-
-                # Delay between counties
-                time.sleep(2)
             except NotImplementedError:
                 print(f"    Skipped - scraper not yet implemented")
             except ScraperError as e:
@@ -149,7 +214,7 @@ def search_court_records(criteria: SearchCriteria) -> list[CourtCase]:
             except Exception as e:
                 print(f"    Unexpected error: {e}")
 
-    return all_cases
+    return list(chain.from_iterable(per_county))
 
 
 def get_api_response(cases: list[CourtCase], criteria: SearchCriteria) -> dict:
@@ -166,29 +231,9 @@ def get_api_response(cases: list[CourtCase], criteria: SearchCriteria) -> dict:
     Returns:
         Dictionary containing search results and metadata
     """
-    # Count open vs closed cases
-    open_cases = [c for c in cases if c.status.upper() in ("OPEN", "ACTIVE", "PENDING")]
-    closed_cases = [c for c in cases if c not in open_cases]
-
-    # Convert cases to dictionaries
-    case_data = []
-    for case in cases:
-        case_dict = {
-            "case_number": case.case_number,
-            "case_type": case.case_type,
-            "filing_date": case.filing_date,
-            "status": case.status,
-            "county": case.county,
-            "parties": case.parties,
-            "court_division": case.court_division,
-            "judge": case.judge,
-            "amount": case.amount,
-            "disposition_date": case.disposition_date,
-            "section": case.section,
-            "verification_instructions": case.verification_instructions,
-            "search_results_url": case.search_results_url,
-        }
-        case_data.append(case_dict)
+    # Convert cases to dictionaries in one C-level attribute fetch per case
+    case_data = [dict(zip(_API_CASE_FIELDS, _get_api_case_fields(case))) for case in cases]
+    open_count = sum(case.is_open for case in cases)
 
     # Determine which counties were actually searched
     if criteria.county:
@@ -208,9 +253,9 @@ def get_api_response(cases: list[CourtCase], criteria: SearchCriteria) -> dict:
         },
         "summary": {
             "total_cases": len(cases),
-            "open_cases": len(open_cases),
-            "closed_cases": len(closed_cases),
-            "has_open_cases": len(open_cases) > 0,
+            "open_cases": open_count,
+            "closed_cases": len(cases) - open_count,
+            "has_open_cases": open_count > 0,
         },
         "cases": case_data,
         "metadata": {
@@ -222,3 +267,22 @@ def get_api_response(cases: list[CourtCase], criteria: SearchCriteria) -> dict:
     }
 
     return response
+
+
+def get_api_response_bytes(cases: list[CourtCase], criteria: SearchCriteria) -> bytes:
+    """
+    Return the get_api_response() payload already serialized as UTF-8 JSON.
+
+    Uses orjson when installed, falling back to the standard library.
+
+    Args:
+        cases: List of CourtCase objects
+        criteria: Original search criteria
+
+    Returns:
+        JSON-encoded response body
+    """
+    response = get_api_response(cases, criteria)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(response)
+    return json.dumps(response, separators=(",", ":")).encode("utf-8")
@@ -4,40 +4,114 @@ Base classes, data models, and shared utilities for court record scrapers.
 This module contains:
 - SearchCriteria and CourtCase dataclasses
 - CountyScraper abstract base class with shared filtering logic
+- ResultCache for memoizing search results in-process
 - ScraperError exception
 - Configuration constants
 """
 
+import asyncio
+import importlib.util
 import re
+import threading
 import time
+from collections import OrderedDict
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Hashable, Optional
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
-from dateutil import parser as date_parser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configuration: How many years back to include cases
 CASE_AGE_LIMIT_YEARS = 5
 
 # Case types to EXCLUDE (not relevant for lending due diligence)
-EXCLUDED_CASE_TYPES = {"Family", "Criminal", "Criminal Felony", "Criminal Misdemeanor", "Traffic"}
+EXCLUDED_CASE_TYPES = frozenset({"Family", "Criminal", "Criminal Felony", "Criminal Misdemeanor", "Traffic"})
 
-# Attempt to import playwright - only needed if JS rendering required
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+# Normalized (lowercase) form used for matching, so "FAMILY" or " Traffic" are excluded too
+_EXCLUDED_CASE_TYPES_LOWER = frozenset(t.lower() for t in EXCLUDED_CASE_TYPES)
+
+# Statuses (uppercased) that count as an open case / current legal exposure
+OPEN_STATUSES = frozenset({"OPEN", "ACTIVE", "PENDING"})
+
+# Playwright is only needed if JS rendering is required. Check that it is
+# installed without importing it (~50 modules); scrapers import it on first use.
+PLAYWRIGHT_AVAILABLE = importlib.util.find_spec("playwright") is not None
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_text: str) -> Optional[float]:
+    """
+    Parse a filing date string into a POSIX timestamp.
+
+    Tries ISO 8601 and MM/DD/YYYY with the C-level datetime parsers before
+    falling back to dateutil's generic (and much slower) parser. Results are
+    cached since the same filing dates recur across a person's cases.
+
+    Args:
+        date_text: Raw date string from a court portal
+
+    Returns:
+        Timestamp as a float, or None if the date is missing or unparseable
+    """
+    if not date_text or date_text == "N/A":
+        return None
+
+    try:
+        return datetime.fromisoformat(date_text).timestamp()
+    except ValueError:
+        pass
+
+    try:
+        return datetime.strptime(date_text, "%m/%d/%Y").timestamp()
+    except ValueError:
+        pass
+
+    # Slow generic fallback; dateutil is imported only when actually needed
+    from dateutil import parser as date_parser
+    try:
+        return date_parser.parse(date_text).timestamp()
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+@lru_cache(maxsize=256)
+def _party_needles(first_name: str, last_name: str, middle_name: Optional[str]) -> tuple[str, tuple[str, ...]]:
+    """
+    Build the casefolded substrings used by the party-name filter.
+
+    A case matches when its casefolded party text contains the last name AND
+    any of: the first name, a first initial + last name ("A. Smith" /
+    "A Smith"), or the middle name. Plain `in` checks on a casefolded string
+    run in CPython's C fast-search and beat a combined regex with lookaheads.
+
+    Args:
+        first_name: Searched first name
+        last_name: Searched last name (required to appear)
+        middle_name: Searched middle name, if any
+
+    Returns:
+        (last_name_needle, any_of_needles)
+    """
+    last = last_name.casefold()
+    first = first_name.casefold()
+    any_of = [first]
+    if first:
+        any_of += [f"{first[0]}. {last}", f"{first[0]} {last}"]
+    if middle_name:
+        any_of.append(middle_name.casefold())
+    return last, tuple(any_of)
 
 
 # ==============================================================================
 # DATA MODELS
 # ==============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SearchCriteria:
     """
     Data class to hold search parameters for court record lookups.
@@ -55,8 +129,17 @@ class SearchCriteria:
     date_of_birth: Optional[str] = None
     county: Optional[str] = None
 
+    def cache_key(self) -> tuple:
+        """Normalized (first, last, middle, DOB) tuple identifying this person."""
+        return (
+            self.first_name.strip().lower(),
+            self.last_name.strip().lower(),
+            (self.middle_name or "").strip().lower(),
+            (self.date_of_birth or "").strip(),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class CourtCase:
     """
     Data class representing a single court case record.
@@ -75,6 +158,9 @@ class CourtCase:
         section: Court section/location information
         verification_instructions: Instructions for manual verification
         search_results_url: URL to view all search results
+        is_open: Derived from status at construction (Open/Active/Pending)
+        filing_ts: Filing date as a POSIX timestamp, parsed once at
+            construction (None if missing or unparseable)
     """
     case_number: str
     case_type: str
@@ -89,6 +175,78 @@ class CourtCase:
     section: str = ""
     verification_instructions: str = ""
     search_results_url: str = ""
+    is_open: bool = field(init=False, default=False, compare=False)
+    filing_ts: Optional[float] = field(init=False, default=None, compare=False)
+
+    def __post_init__(self):
+        self.is_open = self.status.strip().upper() in OPEN_STATUSES
+        self.filing_ts = _parse_date(self.filing_date)
+
+
+# ==============================================================================
+# RESULT CACHE
+# ==============================================================================
+
+class ResultCache:
+    """
+    Thread-safe in-memory LRU cache with a per-entry time-to-live.
+
+    Used by scrapers to skip repeat portal searches for the same person
+    within a short window (e.g. batch re-screens of the same applicants).
+    With stale_ttl set, expired entries are kept that much longer and can
+    still be read through get_stale() (stale-while-revalidate).
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 3600, stale_ttl: float = 0):
+        """
+        Args:
+            maxsize: Maximum number of entries before the least recent is evicted
+            ttl: Seconds an entry stays valid
+            stale_ttl: Extra seconds an expired entry is kept for get_stale()
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        value, fresh = self.get_stale(key)
+        return value if fresh else None
+
+    def get_stale(self, key: Hashable) -> tuple[Optional[Any], bool]:
+        """
+        Return the cached value and whether it is still fresh.
+
+        Returns:
+            (value, True) for a valid entry, (value, False) for an expired
+            entry still within stale_ttl, or (None, False) otherwise
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None, False
+            expires_at, value = entry
+            now = time.monotonic()
+            if expires_at + self.stale_ttl < now:
+                del self._data[key]
+                return None, False
+            self._data.move_to_end(key)
+            return value, expires_at >= now
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
 
 
 # ==============================================================================
@@ -114,16 +272,31 @@ class CountyScraper(ABC):
                       "Chrome/120.0.0.0 Safari/537.36",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate",
     }
 
     # Delay between requests to avoid rate limiting (seconds)
     REQUEST_DELAY = 1.5
 
     def __init__(self):
-        """Initialize the scraper with a requests session."""
+        """Initialize the scraper with a pooled, retrying requests session."""
         self.session = requests.Session()
         self.session.headers.update(self.DEFAULT_HEADERS)
 
+        # Keep-alive connection pool with retry/backoff on transient failures
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "POST"]),
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     @property
     @abstractmethod
     def county_name(self) -> str:
@@ -150,16 +323,34 @@ class CountyScraper(ABC):
         """Add a delay between requests to avoid rate limiting."""
         time.sleep(self.REQUEST_DELAY)
 
-    def _get_page(self, url: str, params: dict = None) -> BeautifulSoup:
+    async def _async_delay(self):
+        """Non-blocking variant of _delay() for async (event-loop) scrapers."""
+        await asyncio.sleep(self.REQUEST_DELAY)
+
+    def _parse_html(self, content: bytes) -> lxml.html.HtmlElement:
         """
-        Fetch a page and return parsed BeautifulSoup object.
+        Parse raw response bytes into an lxml HTML tree.
+
+        Subclasses may override this to use a different parser.
+
+        Args:
+            content: Raw (undecoded) response body
+
+        Returns:
+            Root lxml HtmlElement of the document
+        """
+        return lxml.html.fromstring(content)
+
+    def _get_page(self, url: str, params: dict = None) -> lxml.html.HtmlElement:
+        """
+        Fetch a page and return the parsed HTML tree.
 
         Args:
             url: URL to fetch
             params: Optional query parameters
 
         Returns:
-            BeautifulSoup object of the page content
+            lxml HtmlElement of the page content (query with .xpath()/.cssselect())
 
         Raises:
             ScraperError: If the request fails
@@ -167,20 +358,20 @@ class CountyScraper(ABC):
         try:
             response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
-            return BeautifulSoup(response.text, "lxml")
+            return self._parse_html(response.content)
         except requests.RequestException as e:
             raise ScraperError(f"Failed to fetch {url}: {e}")
 
-    def _post_page(self, url: str, data: dict = None) -> BeautifulSoup:
+    def _post_page(self, url: str, data: dict = None) -> lxml.html.HtmlElement:
         """
-        Submit a POST request and return parsed BeautifulSoup object.
+        Submit a POST request and return the parsed HTML tree.
 
         Args:
             url: URL to post to
             data: Form data to submit
 
         Returns:
-            BeautifulSoup object of the response content
+            lxml HtmlElement of the response content
 
         Raises:
             ScraperError: If the request fails
@@ -188,13 +379,21 @@ class CountyScraper(ABC):
         try:
             response = self.session.post(url, data=data, timeout=30)
             response.raise_for_status()
-            return BeautifulSoup(response.text, "lxml")
+            return self._parse_html(response.content)
         except requests.RequestException as e:
             raise ScraperError(f"Failed to post to {url}: {e}")
 
     def _clean_text(self, text: str) -> str:
-        """Remove extra whitespace and clean text."""
-        return " ".join(text.split()).strip()
+        """
+        Remove extra whitespace and clean text.
+
+        str.split() already treats non-breaking spaces as whitespace and is
+        several times faster than a regex substitution; zero-width spaces,
+        which it does not split on, are dropped first.
+        """
+        if "\u200b" in text:
+            text = text.replace("\u200b", "")
+        return " ".join(text.split())
 
     def _filter_and_sort_cases(self, cases: list[CourtCase], criteria: SearchCriteria = None) -> list[CourtCase]:
         """
@@ -216,79 +415,44 @@ class CountyScraper(ABC):
         Returns:
             Filtered and sorted list of CourtCase objects
         """
-        cutoff_date = datetime.now() - timedelta(days=CASE_AGE_LIMIT_YEARS * 365)
-        filtered = []
-
-        for case in cases:
+        cutoff_ts = (datetime.now() - timedelta(days=CASE_AGE_LIMIT_YEARS * 365)).timestamp()
+        # Surviving cases decorated with their sort key:
+        # (open first, newest first, original position for stability, case)
+        decorated = []
+
+        # Loop-invariant party-name needles
+        if criteria:
+            last_needle, any_of_needles = _party_needles(
+                criteria.first_name, criteria.last_name, criteria.middle_name
+            )
+
+        for position, case in enumerate(cases):
             # Skip excluded case types
-            if case.case_type in EXCLUDED_CASE_TYPES:
+            if case.case_type.strip().lower() in _EXCLUDED_CASE_TYPES_LOWER:
                 continue
 
-            # Parse and check filing date
-            try:
-                if case.filing_date and case.filing_date != "N/A":
-                    case_date = date_parser.parse(case.filing_date)
-                    if case_date < cutoff_date:
-                        continue  # Skip cases older than 5 years
-            except (ValueError, TypeError):
-                pass  # Keep cases with unparseable dates
+            # Check filing date, parsed at construction (unparseable dates are kept)
+            case_ts = case.filing_ts
+            if case_ts is not None and case_ts < cutoff_ts:
+                continue  # Skip cases older than 5 years
 
-            # Additional filtering: check if party names contain search terms
+            # Additional filtering: party text must contain the last name AND
+            # (first name, first initial + last name, or middle name)
             if criteria:
-                party_text = case.parties.lower() if case.parties else ""
-
-                # Require last name to appear
-                last_in_party = criteria.last_name.lower() in party_text
-                if not last_in_party:
+                party_text = case.parties.casefold() if case.parties else ""
+                if last_needle not in party_text:
                     continue
-
-                # For first name, be more flexible - check for first name OR common variations
-                first_name_lower = criteria.first_name.lower()
-                first_in_party = first_name_lower in party_text
-
-                # Also check for common abbreviations or partial matches
-                if not first_in_party:
-                    # Check for first initial + last name pattern (e.g., "A. Smith")
-                    if len(first_name_lower) > 0:
-                        initial_pattern = f"{first_name_lower[0]}\. {criteria.last_name.lower()}"
-                        if initial_pattern in party_text:
-                            first_in_party = True
-
-                        # Check for first initial without dot (e.g., "A Smith")
-                        initial_pattern2 = f"{first_name_lower[0]} {criteria.last_name.lower()}"
-                        if initial_pattern2 in party_text:
-                            first_in_party = True
-
-                # If we have a middle name, check if it appears
-                middle_in_party = False
-                if criteria.middle_name:
-                    middle_in_party = criteria.middle_name.lower() in party_text
-
-                # Keep case if: last name appears AND (first name appears OR middle name appears)
-                # This is stricter than before but still allows for name variations
-                if not (last_in_party and (first_in_party or middle_in_party)):
+                if not any(needle in party_text for needle in any_of_needles):
                     continue
 
-            filtered.append(case)
-
-        # Sort: Open cases first, then by date (newest first)
-        def sort_key(case: CourtCase):
-            # Priority 1: Open cases come first (0), Closed cases after (1)
-            status_priority = 0 if case.status.upper() in ("OPEN", "ACTIVE", "PENDING") else 1
-
-            # Priority 2: Date (newest first, so negate timestamp)
-            try:
-                if case.filing_date and case.filing_date != "N/A":
-                    case_date = date_parser.parse(case.filing_date)
-                    date_score = -case_date.timestamp()
-                else:
-                    date_score = 0
-            except (ValueError, TypeError):
-                date_score = 0
-
-            return (status_priority, date_score)
+            # Sort key: Open cases first (0), then newest first (negated timestamp)
+            status_priority = 0 if case.is_open else 1
+            date_score = -case_ts if case_ts is not None else 0
+            decorated.append((status_priority, date_score, position, case))
 
-        filtered.sort(key=sort_key)
+        # Tuples compare in C; position breaks ties so cases are never compared
+        decorated.sort()
+        filtered = [entry[-1] for entry in decorated]
 
         return filtered
 
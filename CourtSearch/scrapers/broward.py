@@ -5,22 +5,75 @@ Searches the Broward County Clerk subscriber portal for civil/financial cases.
 Website: https://www.browardclerk.org/Web2/
 """
 
+import copy
+import json
+import os
+import re
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
-
-from bs4 import BeautifulSoup
+from urllib.parse import urlparse
 
 from .base import (
     CountyScraper,
     SearchCriteria,
     CourtCase,
+    ResultCache,
     CASE_AGE_LIMIT_YEARS,
     PLAYWRIGHT_AVAILABLE,
 )
+from .browser_pool import browser_pool
+
+
+# Case-type keyword rules, highest priority first: (group, label, keywords).
+# A raw case type gets the label of the first rule with any keyword in it.
+_CASE_TYPE_RULES = (
+    ("felony", "Criminal Felony", ("FELONY", "CRIMINAL")),
+    ("misdemeanor", "Criminal Misdemeanor", ("MISDEMEANOR",)),
+    ("family", "Family", ("FAMILY", "DIVORCE", "CUSTODY", "DISSOLUTION")),
+    ("traffic", "Traffic", ("TRAFFIC", "INFRACTION")),
+    ("foreclosure", "Foreclosure", ("FORECLOSURE",)),
+    ("small_claims", "Small Claims", ("SMALL CLAIMS",)),
+    ("probate", "Probate", ("PROBATE", "ESTATE", "ADMINISTRATION", "WILL")),
+    ("civil", "Civil", ("CIVIL", "CONTRACT", "NEGLIGENCE", "TORT", "PETITION", "CLAIM")),
+)
+
+# All rules in one pattern. Each alternative is a lookahead over the whole
+# string, so alternation order (not match position) decides the winner,
+# preserving the rule priority; lastgroup names the rule that matched.
+_CASE_TYPE_RE = re.compile(
+    "|".join(
+        f"(?=.*?(?:{'|'.join(keywords)}))(?P<{group}>)"
+        for group, _, keywords in _CASE_TYPE_RULES
+    ),
+    re.DOTALL,
+)
+_CASE_TYPE_LABELS = {group: label for group, label, _ in _CASE_TYPE_RULES}
+
+
+@lru_cache(maxsize=256)
+def _normalize_status(status_raw: str) -> str:
+    """
+    Map a raw Broward status/disposition string to Open/Closed.
 
-if PLAYWRIGHT_AVAILABLE:
-    from playwright.sync_api import sync_playwright
+    The portal reuses a small set of status strings, so results are cached.
+
+    Args:
+        status_raw: Raw status text (e.g. "DISPOSED", "Reopened - Active")
+
+    Returns:
+        "Closed", "Open", or the raw status title-cased ("Unknown" if empty)
+    """
+    status_upper = status_raw.upper()
+    if "CLOSED" in status_upper or "DISPOSED" in status_upper:
+        return "Closed"
+    if "OPEN" in status_upper or "ACTIVE" in status_upper or "PENDING" in status_upper:
+        return "Open"
+    return status_raw.title() if status_raw else "Unknown"
 
 
 class BrowardScraper(CountyScraper):
@@ -45,15 +98,166 @@ class BrowardScraper(CountyScraper):
     LOGIN_URL = f"{BASE_URL}/Web2/Account/Login/"
     SEARCH_URL = f"{BASE_URL}/Web2/CaseSearchECA/Index/?AccessLevel=SUBSCRIBER"
 
+    # Constant parts of each case's verification_instructions, which differ
+    # only by case number
+    _VERIFY_PREFIX = (
+        f"To verify this case manually: "
+        f"1. Visit {SEARCH_URL} "
+        f"2. Search for Case Number: "
+    )
+    _VERIFY_SUFFIX = " 3. Verify all details match your records"
+
+    # Resolves once the Kendo results grid has finished loading its data
+    GRID_READY_JS = """() => {
+        if (!window.jQuery) return false;
+        const grid = window.jQuery(".k-grid").data("kendoGrid");
+        if (!grid || grid.dataSource._requestInProgress) return false;
+        return grid.dataSource.total() > 0
+            || !!document.querySelector(".k-grid-norecords, .k-pager-numbers");
+    }"""
+
+    # Kendo grid row fields read by _parse_kendo_data()
+    KENDO_FIELDS = (
+        "CaseNumber",
+        "Style",
+        "CourtType",
+        "CaseUTypeDesc",
+        "SortCaseFiledDate",
+        "DispositionCode",
+        "CaseStatusDesc",
+        "JudgeName",
+        "CourtLocation",
+        "CaseStatusDate",
+    )
+
+    # Data rows of the rendered Kendo results grid (its body table, not the
+    # header table or page layout tables)
+    GRID_ROWS_XPATH = (
+        "//table[contains(@class, 'k-grid-table')]//tr[count(td) >= 5]"
+        " | //div[contains(@class, 'k-grid-content')]//table//tr[count(td) >= 5]"
+    )
+
+    # Upper bound on grid rows pulled back per search. Far above any useful
+    # result set (searches with more than 20 relevant cases already trigger
+    # a "common name" warning), it only stops runaway searches from
+    # serializing and parsing thousands of rows.
+    MAX_GRID_ROWS = 500
+
+    # Returns up to `limit` of the Kendo grid's rows projected onto the given
+    # fields, so only the needed data is serialized back over CDP (null if
+    # there is no grid)
+    GRID_DATA_JS = """([fields, limit]) => {
+        if (!window.jQuery) return null;
+        const grid = window.jQuery(".k-grid").data("kendoGrid");
+        if (!grid) return null;
+        return grid.dataSource.data().slice(0, limit).map(item => {
+            const row = {};
+            for (const field of fields) {
+                if (!(field in item)) continue;
+                const value = item[field];
+                row[field] = value instanceof Date ? value.toJSON() : value;
+            }
+            return row;
+        });
+    }"""
+
+    # Fills the first visible match for each [selectors, value] field and
+    # ticks the first existing checkbox, all in one browser round-trip.
+    # Returns one filled flag per field.
+    FILL_FORM_JS = """({fields, checkboxes}) => {
+        const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+        const filled = fields.map(([selectors, value]) => {
+            for (const selector of selectors) {
+                const el = document.querySelector(selector);
+                if (el && visible(el)) {
+                    el.focus();
+                    el.value = value;
+                    el.dispatchEvent(new Event("input", {bubbles: true}));
+                    el.dispatchEvent(new Event("change", {bubbles: true}));
+                    return true;
+                }
+            }
+            return false;
+        });
+        for (const selector of checkboxes) {
+            const box = document.querySelector(selector);
+            if (box) {
+                if (!box.checked) box.click();
+                break;
+            }
+        }
+        return filled;
+    }"""
+
+    # Tags every visible text-like input with data-emg-idx (0, 1, ...) in
+    # document order and returns how many were tagged
+    TAG_TEXT_INPUTS_JS = """() => {
+        const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+        let count = 0;
+        for (const el of document.querySelectorAll("input")) {
+            el.removeAttribute("data-emg-idx");
+            const type = (el.getAttribute("type") || "text").toLowerCase();
+            if (["text", "search", "email", ""].includes(type) && visible(el)) {
+                el.setAttribute("data-emg-idx", count++);
+            }
+        }
+        return count;
+    }"""
+
+    # Returns the first CAPTCHA selector or page keyword found, else null.
+    # Scans the markup in the browser so the HTML never crosses over CDP.
+    CAPTCHA_PROBE_JS = """() => {
+        const selectors = [
+            "iframe[src*='recaptcha']",
+            "iframe[src*='captcha']",
+            ".g-recaptcha",
+            "#recaptcha",
+            "div[class*='captcha']",
+            "iframe[src*='hcaptcha']",
+            ".hcaptcha",
+            "#hcaptcha",
+        ];
+        const selector = selectors.find(s => document.querySelector(s));
+        if (selector) return selector;
+        const html = document.documentElement.outerHTML.toLowerCase();
+        const keyword = ["captcha", "recaptcha", "hcaptcha", "i'm not a robot"].find(k => html.includes(k));
+        return keyword ? `keyword '${keyword}'` : null;
+    }"""
+
     # Subscriber credentials
     BROWARD_USERNAME = "kurdishYoda"
     BROWARD_PASSWORD = "Courtsearch1!"
 
+    # Filtered results per person, shared by all instances (1 hour TTL)
+    _result_cache = ResultCache(maxsize=512, ttl=3600)
+
+    # Authenticated subscriber session (cookies + localStorage) shared by all
+    # instances and threads, so login runs once per process rather than once
+    # per search. Replaced whenever the portal bounces us back to login.
+    _storage_state: Optional[dict] = None
+    _login_lock = threading.Lock()
+
+    # The session is also saved to disk so a fresh process (e.g. one CLI run)
+    # can skip the login. Saved sessions older than SESSION_MAX_AGE are ignored.
+    SESSION_STATE_PATH = os.path.expanduser(
+        os.environ.get("BROWARD_SESSION_PATH", "~/.cache/aichoir/broward_state.json")
+    )
+    SESSION_MAX_AGE = 8 * 3600
+    _session_loaded = False
+
+    # Long-lived workers for search_batch(); each keeps its pooled browser
+    # (see browser_pool.py) alive between batches
+    BATCH_WORKERS = 5
+    _batch_executor = ThreadPoolExecutor(
+        max_workers=BATCH_WORKERS,
+        thread_name_prefix="broward-batch",
+    )
+
     @property
     def county_name(self) -> str:
         return "Broward"
 
-    def search(self, criteria: SearchCriteria) -> list[CourtCase]:
+    def search(self, criteria: SearchCriteria, use_cache: bool = True) -> list[CourtCase]:
         """
         Search Broward civil court records by party name.
 
@@ -63,12 +267,21 @@ class BrowardScraper(CountyScraper):
         - Only include cases from last 5 years
         - Sort by status (Open first) then date (newest first)
 
+        Non-empty results are cached per person for an hour, so repeat
+        searches skip the login + Playwright round-trip entirely.
+
         Args:
             criteria: SearchCriteria with at minimum first_name and last_name
+            use_cache: Set False to force a live portal search
 
         Returns:
             List of CourtCase objects from Broward County (filtered & sorted)
         """
+        if use_cache:
+            cached = self._get_cached_results(criteria)
+            if cached is not None:
+                return cached
+
         if not PLAYWRIGHT_AVAILABLE:
             print("  Error: Playwright is required for Broward searches.")
             print("  Install with: pip install playwright && playwright install chromium")
@@ -78,6 +291,85 @@ class BrowardScraper(CountyScraper):
         print("    Searching Civil court records...")
         cases = self._search_civil_records(criteria)
 
+        return self._finish_search(cases, criteria)
+
+    def search_batch(
+        self,
+        criteria_list: list[SearchCriteria],
+        max_concurrency: int = BATCH_WORKERS,
+        use_cache: bool = True,
+    ) -> list[list[CourtCase]]:
+        """
+        Search several people concurrently.
+
+        Each portal search runs on its own page in a batch worker thread and
+        reuses the shared subscriber session, so only the first search logs
+        in. Workers only fetch; filtering and sorting happen in the calling
+        thread as each fetch completes, so a worker's browser moves on to
+        the next search straight away.
+
+        Args:
+            criteria_list: One SearchCriteria per person
+            max_concurrency: Maximum simultaneous searches (capped at BATCH_WORKERS)
+            use_cache: Set False to force live portal searches
+
+        Returns:
+            One result list per criteria, in the same order as criteria_list
+            (empty for searches that failed)
+        """
+        results: list[list[CourtCase]] = [[] for _ in criteria_list]
+        pending = {}
+        gate = threading.BoundedSemaphore(max(1, max_concurrency))
+
+        def fetch(criteria: SearchCriteria) -> list[CourtCase]:
+            with gate:
+                return self._search_civil_records(criteria)
+
+        for index, criteria in enumerate(criteria_list):
+            cached = self._get_cached_results(criteria) if use_cache else None
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending[index] = criteria
+
+        if pending and not PLAYWRIGHT_AVAILABLE:
+            print("  Error: Playwright is required for Broward searches.")
+            print("  Install with: pip install playwright && playwright install chromium")
+            return results
+
+        futures = {
+            self._batch_executor.submit(fetch, criteria): index
+            for index, criteria in pending.items()
+        }
+
+        for future in as_completed(futures):
+            index = futures[future]
+            criteria = criteria_list[index]
+            try:
+                results[index] = self._finish_search(future.result(), criteria)
+            except Exception as e:
+                print(f"      Batch search error for {criteria.first_name} {criteria.last_name}: {e}")
+        return results
+
+    def _get_cached_results(self, criteria: SearchCriteria) -> Optional[list[CourtCase]]:
+        """Return copies of cached results for this person, or None on a miss."""
+        cached = self._result_cache.get(criteria.cache_key())
+        if cached is None:
+            return None
+        print(f"    Using cached Broward results ({len(cached)} case(s))")
+        return [copy.copy(case) for case in cached]
+
+    def _finish_search(self, cases: list[CourtCase], criteria: SearchCriteria) -> list[CourtCase]:
+        """
+        Filter, sort and cache raw portal results for one person.
+
+        Args:
+            cases: Unfiltered cases returned by the portal
+            criteria: Search parameters the cases were fetched for
+
+        Returns:
+            Filtered and sorted list of CourtCase objects
+        """
         # Filter and sort results for lending relevance
         filtered_cases = self._filter_and_sort_cases(cases, criteria)
 
@@ -88,6 +380,11 @@ class BrowardScraper(CountyScraper):
             print(f"      Warning: {len(filtered_cases)} cases found. This may indicate a very common name.")
             print(f"      Consider providing middle name or DOB for more specific results.")
 
+        # Only cache non-empty results: an empty list may be a transient
+        # login/CAPTCHA failure rather than a genuine "no records"
+        if filtered_cases:
+            self._result_cache.set(criteria.cache_key(), [copy.copy(case) for case in filtered_cases])
+
         return filtered_cases
 
     def _search_civil_records(self, criteria: SearchCriteria) -> list[CourtCase]:
@@ -121,77 +418,54 @@ class BrowardScraper(CountyScraper):
         """
         try:
             print("      Logging in to Broward County subscriber portal...")
-            page.goto(self.LOGIN_URL, timeout=60000)
-            page.wait_for_load_state("networkidle", timeout=30000)
-            time.sleep(2)
+            # Skip the navigation when the portal already redirected us here
+            if "login" not in page.url.lower():
+                page.goto(self.LOGIN_URL, timeout=60000)
+            try:
+                page.wait_for_selector("input[type='password']", state="visible", timeout=15000)
+            except Exception:
+                pass  # Fall through to the selector probing below
 
-            # Fill username
-            username_selectors = [
+            # Fill username and password and accept the terms checkbox
+            username_selectors = (
                 "input[name='Username']",
                 "input[name='username']",
                 "input[id*='Username']",
                 "input[id*='username']",
                 "input[type='text']",
-            ]
-            filled_user = False
-            for selector in username_selectors:
-                try:
-                    loc = page.locator(selector)
-                    if loc.count() > 0 and loc.first.is_visible():
-                        loc.first.fill(self.BROWARD_USERNAME)
-                        filled_user = True
-                        break
-                except Exception:
-                    continue
-
-            # Fill password
-            password_selectors = [
+            )
+            password_selectors = (
                 "input[name='Password']",
                 "input[name='password']",
                 "input[type='password']",
-            ]
-            filled_pass = False
-            for selector in password_selectors:
-                try:
-                    loc = page.locator(selector)
-                    if loc.count() > 0 and loc.first.is_visible():
-                        loc.first.fill(self.BROWARD_PASSWORD)
-                        filled_pass = True
-                        break
-                except Exception:
-                    continue
+            )
+            terms_selectors = (
+                "input[name='terms']",
+                "input[id*='terms']",
+                "input[type='checkbox']",
+            )
+            filled_user, filled_pass = self._fill_form(
+                page,
+                [
+                    (username_selectors, self.BROWARD_USERNAME),
+                    (password_selectors, self.BROWARD_PASSWORD),
+                ],
+                checkboxes=terms_selectors,
+            )
 
             if not (filled_user and filled_pass):
                 print("      Could not find login form fields")
                 return False
 
-            # Accept terms checkbox
-            terms_selectors = [
-                "input[name='terms']",
-                "input[id*='terms']",
-                "input[type='checkbox']",
-            ]
-            for selector in terms_selectors:
-                try:
-                    loc = page.locator(selector)
-                    if loc.count() > 0:
-                        if not loc.first.is_checked():
-                            loc.first.check()
-                        break
-                except Exception:
-                    continue
-
             # Submit login form - find visible login button
             submitted = False
-            login_buttons = page.locator("button").all()
-            for btn in login_buttons:
-                try:
-                    if btn.is_visible() and "log" in (btn.text_content() or "").lower():
-                        btn.click()
-                        submitted = True
-                        break
-                except Exception:
-                    continue
+            try:
+                login_button = page.locator("button:visible", has_text="log")
+                if login_button.count() > 0:
+                    login_button.first.click()
+                    submitted = True
+            except Exception:
+                pass
 
             if not submitted:
                 # Fallback: submit the form directly via JavaScript
@@ -200,9 +474,11 @@ class BrowardScraper(CountyScraper):
                 except Exception:
                     page.keyboard.press("Enter")
 
-            # Wait for login to complete
-            page.wait_for_load_state("networkidle", timeout=30000)
-            time.sleep(3)
+            # Wait for the post-login redirect away from the login page
+            try:
+                page.wait_for_url(lambda u: "login" not in u.lower(), timeout=20000)
+            except Exception:
+                pass
 
             # Verify login succeeded by checking URL or page content
             current_url = page.url.lower()
@@ -212,8 +488,6 @@ class BrowardScraper(CountyScraper):
                 if "invalid" in content or "incorrect" in content or "error" in content:
                     print("      Login failed: Invalid credentials")
                     return False
-                # Might still be on login page due to redirect delay
-                time.sleep(2)
 
             print("      Login successful")
             return True
@@ -222,6 +496,93 @@ class BrowardScraper(CountyScraper):
             print(f"      Login error: {e}")
             return False
 
+    def _get_session_state(self) -> Optional[dict]:
+        """
+        Return the shared session state, loading the on-disk copy on first use.
+
+        Returns:
+            Playwright storage_state dict, or None if there is no usable session
+        """
+        if not BrowardScraper._session_loaded:
+            with BrowardScraper._login_lock:
+                if not BrowardScraper._session_loaded:
+                    if BrowardScraper._storage_state is None:
+                        BrowardScraper._storage_state = self._load_session_file()
+                    BrowardScraper._session_loaded = True
+        return BrowardScraper._storage_state
+
+    def _load_session_file(self) -> Optional[dict]:
+        """Read the saved session from disk if it exists and is recent enough."""
+        try:
+            age = time.time() - os.path.getmtime(self.SESSION_STATE_PATH)
+            if age > self.SESSION_MAX_AGE:
+                return None
+            with open(self.SESSION_STATE_PATH, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_session_file(self, state: Optional[dict]):
+        """
+        Write (or, for None, remove) the saved session on disk.
+
+        The file is written to a temporary name and renamed into place, so
+        concurrent processes never read a partially written session.
+        """
+        path = self.SESSION_STATE_PATH
+        try:
+            if state is None:
+                if os.path.exists(path):
+                    os.remove(path)
+                return
+
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(state, f)
+                os.chmod(tmp_path, 0o600)  # Session cookies are credentials
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError as e:
+            print(f"      Could not save Broward session: {e}")
+
+    def _ensure_session(self, page, stale_state: Optional[dict]) -> bool:
+        """
+        Log the page's context in, sharing the session with later searches.
+
+        Logins are serialized: if another thread refreshed the shared session
+        while this one waited, its cookies are adopted instead of logging in
+        again.
+
+        Args:
+            page: Playwright page currently redirected to the login page
+            stale_state: Session state the page's context was created with
+
+        Returns:
+            True if the context now holds a logged-in session, False otherwise
+        """
+        with BrowardScraper._login_lock:
+            current_state = BrowardScraper._storage_state
+            if current_state is not None and current_state is not stale_state:
+                page.context.add_cookies(current_state["cookies"])
+                return True
+
+            if not self._login_to_broward(page):
+                BrowardScraper._storage_state = None
+                self._save_session_file(None)
+                return False
+
+            try:
+                BrowardScraper._storage_state = page.context.storage_state()
+            except Exception:
+                BrowardScraper._storage_state = None
+            self._save_session_file(BrowardScraper._storage_state)
+            return True
+
     def _search_with_playwright(
         self,
         url: str,
@@ -232,7 +593,8 @@ class BrowardScraper(CountyScraper):
         Execute search using Playwright with subscriber-level access.
 
         This method:
-        1. Logs in to the Broward Clerk subscriber portal
+        1. Logs in to the Broward Clerk subscriber portal (reusing the
+           process-wide session when it is still valid)
         2. Navigates to the subscriber case search page
         3. Fills in the search form
         4. Parses the results
@@ -246,50 +608,67 @@ class BrowardScraper(CountyScraper):
             List of CourtCase objects
         """
         cases = []
+        session_state = self._get_session_state()
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent=self.DEFAULT_HEADERS["User-Agent"]
-            )
-            page = context.new_page()
-
+        with browser_pool.page(
+            user_agent=self.DEFAULT_HEADERS["User-Agent"],
+            storage_state=session_state,
+        ) as page:
             try:
-                # Step 1: Log in to the subscriber portal
-                logged_in = self._login_to_broward(page)
-                if not logged_in:
-                    print("      Could not log in to Broward subscriber portal")
-                    print(f"      For manual search, visit: {self.SEARCH_URL}")
-                    print(f"      Search: {criteria.first_name} {criteria.last_name}")
-                    return []
-
-                # Step 2: Navigate to subscriber case search
+                # Step 1: Open subscriber case search with the saved session;
+                # the portal redirects to the login page if it has expired
                 page.goto(self.SEARCH_URL, timeout=60000)
-                page.wait_for_load_state("networkidle", timeout=30000)
-                time.sleep(3)
-
-                # Select the Party Name search tab
-                party_selectors = [
-                    "a:has-text('Party Name')",
-                    "button:has-text('Party Name')",
-                    ".tab:has-text('Party Name')",
-                    "[role='tab']:has-text('Party Name')",
-                    "#partyNameTab",
-                    "[href*='Party']",
-                    "li:has-text('Party Name')",
-                    "a:has-text('Party')",
+
+                if "login" in page.url.lower():
+                    if not self._ensure_session(page, session_state):
+                        print("      Could not log in to Broward subscriber portal")
+                        print(f"      For manual search, visit: {self.SEARCH_URL}")
+                        print(f"      Search: {criteria.first_name} {criteria.last_name}")
+                        return []
+
+                    # Step 2: Navigate to subscriber case search, unless the
+                    # post-login redirect (ReturnUrl) already landed there.
+                    # Only the path counts: the login page's own query string
+                    # (?ReturnUrl=...CaseSearchECA...) names it too, and a page
+                    # that adopted another thread's cookies is still on login
+                    if "casesearcheca" not in urlparse(page.url).path.lower():
+                        page.goto(self.SEARCH_URL, timeout=60000)
+
+                try:
+                    page.wait_for_selector(
+                        "a:has-text('Party'), [role='tab']:has-text('Party'), #lastName",
+                        state="visible",
+                        timeout=15000,
+                    )
+                except Exception:
+                    pass
+
+                # Select the Party Name search tab (exact tab matches first,
+                # looser "Party" links only if none of those are visible)
+                party_selector_groups = [
+                    (
+                        "a:has-text('Party Name')",
+                        "button:has-text('Party Name')",
+                        ".tab:has-text('Party Name')",
+                        "[role='tab']:has-text('Party Name')",
+                        "#partyNameTab",
+                    ),
+                    (
+                        "[href*='Party']",
+                        "li:has-text('Party Name')",
+                        "a:has-text('Party')",
+                    ),
                 ]
 
-                for selector in party_selectors:
+                if self._click_first_visible(page, party_selector_groups):
                     try:
-                        loc = page.locator(selector)
-                        if loc.count() > 0 and loc.first.is_visible():
-                            loc.first.click()
-                            page.wait_for_load_state("networkidle", timeout=30000)
-                            time.sleep(2)
-                            break
+                        page.wait_for_selector(
+                            "#lastName, input[name='lastName']",
+                            state="visible",
+                            timeout=10000,
+                        )
                     except Exception:
-                        continue
+                        pass
 
                 # Step 3: Fill the search form
                 filled_form = self._fill_broward_search_form(page, criteria)
@@ -303,47 +682,51 @@ class BrowardScraper(CountyScraper):
                     print(f"      For manual search, visit: {self.SEARCH_URL}")
                     return []
 
-                # Step 4: Submit the search
-                self._submit_broward_search(page)
-
-                # Wait for results page to navigate and fully render
-                # The results page uses a Kendo UI grid that loads data via AJAX
-                time.sleep(3)
-                page.wait_for_load_state("networkidle", timeout=30000)
-                time.sleep(3)
+                # Step 4: Submit the search, waiting for the portal's
+                # response rather than for the whole network to go idle
+                try:
+                    with page.expect_response(self._is_search_response, timeout=30000):
+                        self._submit_broward_search(page)
+                except Exception:
+                    pass  # The grid wait below still bounds how long we wait
 
-                # Wait for the Kendo grid pagination to appear (signals data is loaded)
+                # Wait until the Kendo grid's data request has finished and
+                # either rows or the "no records" placeholder are present
                 try:
-                    page.wait_for_selector(".k-pager-numbers", timeout=20000)
-                    time.sleep(2)
+                    page.wait_for_function(self.GRID_READY_JS, timeout=25000)
                 except Exception:
-                    # Fallback: just wait longer for AJAX
-                    time.sleep(5)
+                    pass  # Fall through and extract whatever has loaded
 
                 # Extract data directly from the Kendo grid via JavaScript
                 # The Kendo grid stores data in memory; DOM may not have it yet
                 try:
-                    grid_data = page.evaluate("""() => {
-                        const grid = $(".k-grid").data("kendoGrid");
-                        if (!grid) return null;
-                        const data = grid.dataSource.data();
-                        return data.map(item => item.toJSON ? item.toJSON() : item);
-                    }""")
-                    if grid_data:
-                        cases = self._parse_kendo_data(grid_data, case_type_default)
+                    grid_data = page.evaluate(
+                        self.GRID_DATA_JS, [list(self.KENDO_FIELDS), self.MAX_GRID_ROWS]
+                    )
                 except Exception:
-                    pass
-                    # Fallback: parse the rendered HTML
+                    grid_data = None
+
+                if grid_data and len(grid_data) >= self.MAX_GRID_ROWS:
+                    print(f"      Warning: results truncated to the first {self.MAX_GRID_ROWS} rows.")
+                    print(f"      Provide a middle name or DOB to narrow the search.")
+
+                if grid_data:
+                    cases = self._parse_kendo_data(grid_data, case_type_default)
+                else:
+                    # Fallback: parse the rendered HTML (only when the grid
+                    # data is unavailable - page.content() is a large transfer)
                     content = page.content()
                     cases = self._parse_broward_results(content, case_type_default)
 
             except Exception as e:
                 print(f"      Search error: {e}")
-            finally:
-                browser.close()
 
         return cases
 
+    def _is_search_response(self, response) -> bool:
+        """Match a successful case-search response (results page or grid data XHR)."""
+        return "CaseSearchECA" in response.url and response.ok
+
     def _parse_kendo_data(self, grid_data: list, case_type_default: str) -> list[CourtCase]:
         """
         Parse case data extracted directly from the Kendo grid's JavaScript data source.
@@ -394,25 +777,14 @@ class BrowardScraper(CountyScraper):
                 case_type = self._classify_broward_case_type(case_type_raw, case_type_default)
 
                 # Normalize status
-                status_upper = status_raw.upper()
-                if "CLOSED" in status_upper or "DISPOSED" in status_upper:
-                    status = "Closed"
-                elif "OPEN" in status_upper or "ACTIVE" in status_upper or "PENDING" in status_upper:
-                    status = "Open"
-                else:
-                    status = status_raw.title() if status_raw else "Unknown"
+                status = _normalize_status(status_raw)
 
                 # Extract additional details
                 judge = str(item.get("JudgeName", ""))
                 court_division = str(item.get("CourtLocation", ""))
                 disposition_date = str(item.get("CaseStatusDate", ""))
 
-                verification_instructions = (
-                    f"To verify this case manually: "
-                    f"1. Visit {self.SEARCH_URL} "
-                    f"2. Search for Case Number: {case_number} "
-                    f"3. Verify all details match your records"
-                )
+                verification_instructions = self._VERIFY_PREFIX + case_number + self._VERIFY_SUFFIX
 
                 cases.append(CourtCase(
                     case_number=case_number,
@@ -445,82 +817,65 @@ class BrowardScraper(CountyScraper):
         Returns:
             True if form was successfully filled, False otherwise
         """
-        filled_last = False
-        filled_first = False
-
         # Broward subscriber portal uses these specific field IDs
         # lastName is type='search', firstName/middleName are type='text'
-        last_name_selectors = [
-            "#lastName",
-            "input[name='lastName']",
-            "input[placeholder='Last Name']",
+        fields = [
+            (("#lastName", "input[name='lastName']", "input[placeholder='Last Name']"),
+             criteria.last_name),
+            (("#firstName", "input[name='firstName']", "input[placeholder='First Name']"),
+             criteria.first_name),
         ]
 
-        first_name_selectors = [
-            "#firstName",
-            "input[name='firstName']",
-            "input[placeholder='First Name']",
-        ]
-
-        # Fill last name
-        for selector in last_name_selectors:
-            try:
-                loc = page.locator(selector)
-                if loc.count() > 0 and loc.first.is_visible():
-                    loc.first.fill(criteria.last_name)
-                    filled_last = True
-                    break
-            except Exception:
-                continue
-
-        # Fill first name
-        for selector in first_name_selectors:
-            try:
-                loc = page.locator(selector)
-                if loc.count() > 0 and loc.first.is_visible():
-                    loc.first.fill(criteria.first_name)
-                    filled_first = True
-                    break
-            except Exception:
-                continue
-
         # Optionally fill middle name
         if criteria.middle_name:
-            middle_selectors = [
-                "#middleName",
-                "input[name='middleName']",
-                "input[placeholder='Middle Name']",
-            ]
-            for selector in middle_selectors:
-                try:
-                    loc = page.locator(selector)
-                    if loc.count() > 0 and loc.first.is_visible():
-                        loc.first.fill(criteria.middle_name)
-                        break
-                except Exception:
-                    continue
+            fields.append(
+                (("#middleName", "input[name='middleName']", "input[placeholder='Middle Name']"),
+                 criteria.middle_name)
+            )
 
         # Optionally fill filing date range to limit to last N years
-        try:
-            from_date = (datetime.now() - timedelta(days=CASE_AGE_LIMIT_YEARS * 365)).strftime("%m/%d/%Y")
-            date_from_selectors = [
-                "#filingDateOnOrAfterP",
-                "input[name='filingDateOnOrAfterP']",
-            ]
-            for selector in date_from_selectors:
-                try:
-                    loc = page.locator(selector)
-                    if loc.count() > 0 and loc.first.is_visible():
-                        loc.first.fill(from_date)
-                        loc.first.dispatch_event("change")
-                        break
-                except Exception:
-                    continue
-        except Exception:
-            pass
+        from_date = (datetime.now() - timedelta(days=CASE_AGE_LIMIT_YEARS * 365)).strftime("%m/%d/%Y")
+        fields.append(
+            (("#filingDateOnOrAfterP", "input[name='filingDateOnOrAfterP']"), from_date)
+        )
+
+        filled = self._fill_form(page, fields)
+        filled_last, filled_first = filled[0], filled[1]
 
         return filled_first and filled_last
 
+    def _fill_form(
+        self,
+        page,
+        fields: list[tuple[tuple[str, ...], str]],
+        checkboxes: tuple[str, ...] = (),
+    ) -> list[bool]:
+        """
+        Fill several form fields with a single page.evaluate call.
+
+        Each field is filled into the first visible element matching one of
+        its selectors (tried in order), instead of probing every selector
+        with separate count()/is_visible() round-trips.
+
+        Args:
+            page: Playwright page object
+            fields: (selectors, value) pairs
+            checkboxes: Selectors tried in order; the first match is checked
+
+        Returns:
+            One flag per field, True if it was filled
+        """
+        try:
+            return page.evaluate(
+                self.FILL_FORM_JS,
+                {
+                    "fields": [[list(selectors), value] for selectors, value in fields],
+                    "checkboxes": list(checkboxes),
+                },
+            )
+        except Exception:
+            return [False] * len(fields)
+
     def _emergency_broward_form_fill(self, page, criteria: SearchCriteria) -> bool:
         """
         Emergency fallback for Broward form filling.
@@ -534,26 +889,14 @@ class BrowardScraper(CountyScraper):
             True if form was filled, False otherwise
         """
         try:
-            # Try to find any input that might accept text
-            all_inputs = page.locator("input").all()
-            text_inputs = []
+            # Tag the visible text inputs in one round-trip
+            input_count = self._tag_text_inputs(page)
+            print(f"      Emergency mode: Found {input_count} visible text inputs")
 
-            for inp in all_inputs:
-                try:
-                    input_type = inp.get_attribute("type") or "text"
-                    if input_type in ["text", "search", "email", "", None]:
-                        if inp.is_visible():
-                            text_inputs.append(inp)
-                except:
-                    continue
-
-            print(f"      Emergency mode: Found {len(text_inputs)} visible text inputs")
-
-            if len(text_inputs) >= 2:
+            if input_count >= 2:
                 # Try to fill the first two visible text inputs
                 try:
-                    text_inputs[0].fill(criteria.first_name)
-                    text_inputs[1].fill(criteria.last_name)
+                    self._fill_tagged_names(page, criteria)
                     print(f"      Emergency fill successful: {criteria.first_name} {criteria.last_name}")
                     return True
                 except Exception as e:
@@ -563,25 +906,17 @@ class BrowardScraper(CountyScraper):
             try:
                 print("      Trying to click page to activate dynamic content...")
                 page.click("body", timeout=5000)
-                time.sleep(2)
+                try:
+                    page.wait_for_selector("input:visible", timeout=5000)
+                except Exception:
+                    pass
 
                 # Check again for inputs after clicking
-                all_inputs = page.locator("input").all()
-                text_inputs = []
-                for inp in all_inputs:
-                    try:
-                        input_type = inp.get_attribute("type") or "text"
-                        if input_type in ["text", "search", "email", "", None]:
-                            if inp.is_visible():
-                                text_inputs.append(inp)
-                    except:
-                        continue
-
-                print(f"      After click: Found {len(text_inputs)} visible text inputs")
-
-                if len(text_inputs) >= 2:
-                    text_inputs[0].fill(criteria.first_name)
-                    text_inputs[1].fill(criteria.last_name)
+                input_count = self._tag_text_inputs(page)
+                print(f"      After click: Found {input_count} visible text inputs")
+
+                if input_count >= 2:
+                    self._fill_tagged_names(page, criteria)
                     print(f"      Emergency fill after click successful: {criteria.first_name} {criteria.last_name}")
                     return True
 
@@ -593,6 +928,26 @@ class BrowardScraper(CountyScraper):
 
         return False
 
+    def _tag_text_inputs(self, page) -> int:
+        """
+        Tag the page's visible text inputs for the emergency form fill.
+
+        Args:
+            page: Playwright page object
+
+        Returns:
+            Number of inputs tagged with data-emg-idx (0 on error)
+        """
+        try:
+            return page.evaluate(self.TAG_TEXT_INPUTS_JS)
+        except Exception:
+            return 0
+
+    def _fill_tagged_names(self, page, criteria: SearchCriteria):
+        """Fill first/last name into the first two inputs tagged by _tag_text_inputs()."""
+        page.locator("[data-emg-idx='0']").fill(criteria.first_name)
+        page.locator("[data-emg-idx='1']").fill(criteria.last_name)
+
     def _has_captcha(self, page) -> bool:
         """
         Check if the Broward County page contains a CAPTCHA challenge.
@@ -603,36 +958,14 @@ class BrowardScraper(CountyScraper):
         Returns:
             True if CAPTCHA is detected
         """
-        captcha_indicators = [
-            "iframe[src*='recaptcha']",
-            "iframe[src*='captcha']",
-            ".g-recaptcha",
-            "#recaptcha",
-            "div[class*='captcha']",
-            "iframe[src*='hcaptcha']",
-            ".hcaptcha",
-            "#hcaptcha",
-        ]
-
-        for selector in captcha_indicators:
-            try:
-                if page.locator(selector).count() > 0:
-                    print(f"      Found CAPTCHA indicator: {selector}")
-                    return True
-            except Exception:
-                continue
-
-        # Check page content for CAPTCHA-specific text
         try:
-            content = page.content().lower()
-            captcha_keywords = ['captcha', 'recaptcha', 'hcaptcha', "i'm not a robot"]
-            for keyword in captcha_keywords:
-                if keyword in content:
-                    print(f"      Found CAPTCHA keyword in page content: '{keyword}'")
-                    return True
+            indicator = page.evaluate(self.CAPTCHA_PROBE_JS)
         except Exception:
-            pass
+            return False
 
+        if indicator:
+            print(f"      Found CAPTCHA indicator: {indicator}")
+            return True
         return False
 
     def _submit_broward_search(self, page):
@@ -643,20 +976,13 @@ class BrowardScraper(CountyScraper):
             page: Playwright page object
         """
         # The subscriber portal has a specific button for party name search
-        submit_selectors = [
-            "#PersonSearchResults",
-            "button:has-text('Search'):visible",
-            "button[type='submit']:visible",
+        submit_selector_groups = [
+            ("#PersonSearchResults",),
+            ("button:has-text('Search')", "button[type='submit']"),
         ]
 
-        for selector in submit_selectors:
-            try:
-                locator = page.locator(selector)
-                if locator.count() > 0 and locator.first.is_visible():
-                    locator.first.click()
-                    return
-            except Exception:
-                continue
+        if self._click_first_visible(page, submit_selector_groups):
+            return
 
         # Fallback: try pressing Enter
         try:
@@ -664,6 +990,32 @@ class BrowardScraper(CountyScraper):
         except Exception:
             pass
 
+    def _click_first_visible(self, page, selector_groups: list[tuple[str, ...]]) -> bool:
+        """
+        Click the first visible element matching a group of selectors.
+
+        Each group is fused into one selector list, so a group costs a single
+        count() plus the click instead of count()/is_visible() per selector.
+        Groups are tried in priority order; within a group the first visible
+        match in document order wins.
+
+        Args:
+            page: Playwright page object
+            selector_groups: Selector tuples, highest priority first
+
+        Returns:
+            True if an element was clicked, False otherwise
+        """
+        for group in selector_groups:
+            try:
+                loc = page.locator(", ".join(f"{selector}:visible" for selector in group))
+                if loc.count() > 0:
+                    loc.first.click()
+                    return True
+            except Exception:
+                continue
+        return False
+
     def _parse_broward_results(self, html_content: str, case_type_default: str) -> list[CourtCase]:
         """
         Parse search results from Broward County subscriber portal.
@@ -680,27 +1032,27 @@ class BrowardScraper(CountyScraper):
             List of CourtCase objects extracted from the page
         """
         cases = []
-        soup = BeautifulSoup(html_content, "lxml")
-
-        # Find all tables and look for the one with case data rows
-        tables = soup.find_all("table")
-        for table in tables:
-            rows = table.find_all("tr")
-            if not rows:
-                continue
-
-            for row in rows:
-                cells = row.find_all("td")
-                # The data table has 6 columns:
-                # Case Number, Case Style, Case Type, Filing Date, Case Status, Access Level
-                if len(cells) >= 5:
-                    case = self._parse_broward_table_row(cells, case_type_default)
-                    if case:
-                        cases.append(case)
+        if not html_content:
+            return cases
+        tree = self._parse_html(html_content)
+
+        # The data table has 6 columns:
+        # Case Number, Case Style, Case Type, Filing Date, Case Status, Access Level
+        # Read only the Kendo grid's data table when it is present; otherwise
+        # fall back to every 5+ cell row on the page (each exactly once)
+        rows = tree.xpath(self.GRID_ROWS_XPATH)
+        if not rows:
+            rows = tree.xpath("//table//tr[count(td) >= 5]")
+
+        for row in rows:
+            cell_texts = [self._clean_text(cell.text_content()) for cell in row.xpath("./td")]
+            case = self._parse_broward_table_row(cell_texts, case_type_default)
+            if case:
+                cases.append(case)
 
         return cases
 
-    def _parse_broward_table_row(self, cells: list, case_type_default: str) -> Optional[CourtCase]:
+    def _parse_broward_table_row(self, cell_texts: list[str], case_type_default: str) -> Optional[CourtCase]:
         """
         Parse a Broward subscriber portal table row into a CourtCase object.
 
@@ -708,15 +1060,13 @@ class BrowardScraper(CountyScraper):
         Case Status, Access Level.
 
         Args:
-            cells: List of table cell elements
+            cell_texts: Cleaned text of each table cell, in column order
             case_type_default: Default case type
 
         Returns:
             CourtCase object or None
         """
         try:
-            cell_texts = [self._clean_text(cell.get_text()) for cell in cells]
-
             if not any(cell_texts):
                 return None
 
@@ -734,24 +1084,13 @@ class BrowardScraper(CountyScraper):
             case_type = self._classify_broward_case_type(case_type_raw, case_type_default)
 
             # Normalize status
-            status_upper = status_raw.upper()
-            if "CLOSED" in status_upper or "DISPOSED" in status_upper:
-                status = "Closed"
-            elif "OPEN" in status_upper or "ACTIVE" in status_upper or "PENDING" in status_upper:
-                status = "Open"
-            else:
-                status = status_raw.title() if status_raw else "Unknown"
+            status = _normalize_status(status_raw)
 
             # Normalize filing date (Broward uses MM-DD-YYYY format)
             filing_date = filing_date.replace("-", "/")
 
             # Generate verification instructions
-            verification_instructions = (
-                f"To verify this case manually: "
-                f"1. Visit {self.SEARCH_URL} "
-                f"2. Search for Case Number: {case_number} "
-                f"3. Verify all details match your records"
-            )
+            verification_instructions = self._VERIFY_PREFIX + case_number + self._VERIFY_SUFFIX
 
             return CourtCase(
                 case_number=case_number,
@@ -777,25 +1116,5 @@ class BrowardScraper(CountyScraper):
         Returns:
             Classified case type string
         """
-        ct = case_type_raw.upper()
-
-        if any(term in ct for term in ["FELONY", "CRIMINAL"]):
-            return "Criminal Felony"
-        elif any(term in ct for term in ["MISDEMEANOR"]):
-            return "Criminal Misdemeanor"
-        elif any(term in ct for term in ["FAMILY", "DIVORCE", "CUSTODY", "DISSOLUTION"]):
-            return "Family"
-        elif any(term in ct for term in ["TRAFFIC", "INFRACTION"]):
-            return "Traffic"
-        elif any(term in ct for term in ["FORECLOSURE"]):
-            return "Foreclosure"
-        elif any(term in ct for term in ["SMALL CLAIMS"]):
-            return "Small Claims"
-        elif any(term in ct for term in ["PROBATE", "ESTATE", "ADMINISTRATION", "WILL"]):
-            return "Probate"
-        elif any(term in ct for term in ["CIVIL", "CONTRACT", "NEGLIGENCE", "TORT"]):
-            return "Civil"
-        elif any(term in ct for term in ["PETITION", "CLAIM"]):
-            return "Civil"
-        else:
-            return default
+        match = _CASE_TYPE_RE.match(case_type_raw.upper())
+        return _CASE_TYPE_LABELS[match.lastgroup] if match else default
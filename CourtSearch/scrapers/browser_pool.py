@@ -0,0 +1,357 @@
+"""
+Shared headless Chromium for sync Playwright scrapers.
+
+Launching Chromium costs 0.5-2 seconds and ~150 MB per launch, so instead of
+every search starting its own browser, BrowserPool keeps one browser alive
+and hands out short-lived, isolated contexts (cookies/storage are never
+shared between searches).
+
+Sync Playwright objects are bound to the thread that created them, so the
+pool keeps one browser per thread. Long-lived worker threads (such as the
+statewide search executor) therefore reuse their browser across searches.
+
+Async Playwright scrapers use AsyncBrowserPool instead, which shares one
+browser per event loop.
+
+Usage:
+    from .browser_pool import browser_pool
+
+    with browser_pool.page(user_agent="...") as page:
+        page.goto(url)
+        html = page.content()
+"""
+
+import asyncio
+import atexit
+import threading
+from contextlib import asynccontextmanager, contextmanager
+
+# Subresources aborted before they are fetched; scrapers only read DOM text.
+# Stylesheets are deliberately still loaded: the scrapers rely on
+# is_visible()/:visible checks, which depend on CSS.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Analytics/tracking hosts aborted whatever their resource type; they never
+# carry case data and often hold "networkidle" waits open.
+BLOCKED_URL_KEYWORDS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "hotjar.com",
+    "facebook.net",
+)
+
+# Chromium flags for every pooled browser. /dev/shm is tiny in most
+# containers; without the first flag long-lived browsers crash under memory
+# pressure. The second stops Chromium's own background traffic (component
+# updates, safe-browsing list fetches) competing with page loads.
+LAUNCH_ARGS = ("--disable-dev-shm-usage", "--disable-background-networking")
+
+
+class BrowserPool:
+    """
+    Per-thread pool of long-lived headless Chromium browsers.
+
+    Each thread lazily launches one browser on first use. Every call to
+    page() opens a fresh browser context, which is closed again on exit.
+    Browsers are recycled after max_uses contexts to bound memory growth.
+    """
+
+    def __init__(
+        self,
+        max_uses: int = 50,
+        block_resources: frozenset[str] = BLOCKED_RESOURCE_TYPES,
+        block_urls: tuple[str, ...] = BLOCKED_URL_KEYWORDS,
+        default_timeout: int = 15000,
+        launch_args: tuple[str, ...] = LAUNCH_ARGS,
+    ):
+        """
+        Args:
+            max_uses: Number of contexts served before a browser is relaunched
+            block_resources: Playwright resource types to abort (empty to disable)
+            block_urls: URL substrings to abort (empty to disable)
+            default_timeout: Default action/wait timeout for new contexts (ms)
+            launch_args: Extra Chromium command-line flags
+        """
+        self.max_uses = max_uses
+        self.block_resources = block_resources
+        self.block_urls = block_urls
+        self.default_timeout = default_timeout
+        self.launch_args = launch_args
+        self._local = threading.local()
+
+    def _get_browser(self):
+        """Return the calling thread's browser, launching or recycling it as needed."""
+        local = self._local
+        browser = getattr(local, "browser", None)
+
+        if browser is not None and (local.uses >= self.max_uses or not browser.is_connected()):
+            self.close()
+            browser = None
+
+        if browser is None:
+            # Imported lazily so loading the package doesn't pay Playwright's import cost
+            from playwright.sync_api import sync_playwright
+
+            local.playwright = sync_playwright().start()
+            try:
+                local.browser = local.playwright.chromium.launch(
+                    headless=True,
+                    args=list(self.launch_args),
+                )
+            except Exception:
+                self.close()
+                raise
+            local.uses = 0
+
+        local.uses += 1
+        return local.browser
+
+    def warm(self):
+        """Launch the calling thread's browser now so its first page() is fast."""
+        self._get_browser()
+        self._local.uses -= 1  # Launching alone doesn't count as a use
+
+    @contextmanager
+    def page(self, **context_options):
+        """
+        Yield a new page in a fresh, isolated browser context.
+
+        Args:
+            **context_options: Passed through to browser.new_context()
+                (e.g. user_agent, viewport, locale)
+
+        Yields:
+            Playwright Page object; its context is closed on exit
+        """
+        context = self._get_browser().new_context(**context_options)
+        context.set_default_timeout(self.default_timeout)
+        if self.block_resources or self.block_urls:
+            context.route("**/*", self._route_request)
+        try:
+            yield context.new_page()
+        finally:
+            try:
+                context.close()
+            except Exception:
+                pass
+
+    def _route_request(self, route):
+        """Abort blocked resource types and tracker URLs, let everything else through."""
+        request = route.request
+        if request.resource_type in self.block_resources:
+            route.abort()
+            return
+        url = request.url
+        if any(keyword in url for keyword in self.block_urls):
+            route.abort()
+        else:
+            route.continue_()
+
+    def close(self):
+        """Close the calling thread's browser and Playwright driver, if any."""
+        local = self._local
+        browser = getattr(local, "browser", None)
+        playwright = getattr(local, "playwright", None)
+        local.browser = None
+        local.playwright = None
+
+        if browser is not None:
+            try:
+                browser.close()
+            except Exception:
+                pass
+        if playwright is not None:
+            try:
+                playwright.stop()
+            except Exception:
+                pass
+
+
+class AsyncBrowserPool:
+    """
+    Long-lived headless Chromium for async Playwright scrapers.
+
+    One browser is launched lazily and shared by every coroutine on the
+    event loop that launched it. Contexts are kept open and cached by their
+    options, so searches with the same fingerprint share cookies (such as a
+    Cloudflare clearance) and only pay for a new page. A semaphore bounds
+    the number of pages open at once.
+
+    Async Playwright objects belong to the loop that created them. When the
+    pool is used from a different loop, the old browser is closed on its own
+    loop and a new one is launched; switching loops while pages are still
+    open on the old one raises RuntimeError. Resource and tracker blocking
+    work as in BrowserPool.
+    """
+
+    def __init__(
+        self,
+        max_pages: int = 8,
+        block_resources: frozenset[str] = BLOCKED_RESOURCE_TYPES,
+        block_urls: tuple[str, ...] = BLOCKED_URL_KEYWORDS,
+        default_timeout: int = 15000,
+        launch_args: tuple[str, ...] = LAUNCH_ARGS,
+    ):
+        """
+        Args:
+            max_pages: Maximum pages open at once across all contexts
+            block_resources: Playwright resource types to abort (empty to disable)
+            block_urls: URL substrings to abort (empty to disable)
+            default_timeout: Default action/wait timeout for new contexts (ms)
+            launch_args: Extra Chromium command-line flags
+        """
+        self.max_pages = max_pages
+        self.block_resources = block_resources
+        self.block_urls = block_urls
+        self.default_timeout = default_timeout
+        self.launch_args = launch_args
+        self._loop = None
+        self._playwright = None
+        self._browser = None
+        self._contexts = {}
+        self._semaphore = None
+        self._lock = None
+        self._open_pages = 0
+
+    def _bind_loop(self):
+        """
+        Bind the pool to the running event loop, retiring the previous loop's
+        browser if it was last used on a different one.
+
+        Raises:
+            RuntimeError: If pages are still open on the previous loop
+        """
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+
+        old_loop = self._loop
+        if old_loop is not None:
+            if self._open_pages:
+                # A fresh semaphore here would stop bounding the old pages
+                raise RuntimeError(
+                    "AsyncBrowserPool is still serving pages on another event loop"
+                )
+            state = (list(self._contexts.values()), self._browser, self._playwright)
+            if any(state[1:]) and old_loop.is_running() and not old_loop.is_closed():
+                # Playwright objects can only be closed on their own loop
+                asyncio.run_coroutine_threadsafe(self._close_objects(*state), old_loop)
+            # (If the old loop has stopped, its driver can no longer be
+            # reached; it exits with the process.)
+
+        self._loop = loop
+        self._playwright = None
+        self._browser = None
+        self._contexts = {}
+        self._semaphore = asyncio.Semaphore(self.max_pages)
+        self._lock = asyncio.Lock()
+
+    async def _get_context(self, context_options: dict):
+        """Return the cached context for these options, launching the browser as needed."""
+        key = repr(sorted(context_options.items()))
+        async with self._lock:
+            if self._browser is not None and not self._browser.is_connected():
+                await self.close()
+
+            if self._browser is None:
+                # Imported lazily so loading the package doesn't pay Playwright's import cost
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+                try:
+                    self._browser = await self._playwright.chromium.launch(
+                        headless=True,
+                        args=list(self.launch_args),
+                    )
+                except Exception:
+                    await self.close()
+                    raise
+
+            context = self._contexts.get(key)
+            if context is None:
+                context = await self._browser.new_context(**context_options)
+                context.set_default_timeout(self.default_timeout)
+                if self.block_resources or self.block_urls:
+                    await context.route("**/*", self._route_request)
+                self._contexts[key] = context
+            return context
+
+    @asynccontextmanager
+    async def page(self, **context_options):
+        """
+        Yield a new page in the shared context for these options.
+
+        Args:
+            **context_options: Passed through to browser.new_context() the
+                first time these options are seen
+
+        Yields:
+            Async Playwright Page object; the page is closed on exit
+        """
+        self._bind_loop()
+        async with self._semaphore:
+            self._open_pages += 1
+            try:
+                context = await self._get_context(context_options)
+                page = await context.new_page()
+                try:
+                    yield page
+                finally:
+                    try:
+                        await page.close()
+                    except Exception:
+                        pass
+            finally:
+                self._open_pages -= 1
+
+    async def _route_request(self, route):
+        """Abort blocked resource types and tracker URLs, let everything else through."""
+        request = route.request
+        if request.resource_type in self.block_resources:
+            await route.abort()
+            return
+        url = request.url
+        if any(keyword in url for keyword in self.block_urls):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def close(self):
+        """Close the contexts, browser and Playwright driver, if any."""
+        contexts = list(self._contexts.values())
+        browser = self._browser
+        playwright = self._playwright
+        self._contexts = {}
+        self._browser = None
+        self._playwright = None
+        await self._close_objects(contexts, browser, playwright)
+
+    @staticmethod
+    async def _close_objects(contexts, browser, playwright):
+        """Close the given contexts, browser and Playwright driver, ignoring errors."""
+        for context in contexts:
+            try:
+                await context.close()
+            except Exception:
+                pass
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception:
+                pass
+
+
+# Module-level pools shared by all sync / async Playwright scrapers
+browser_pool = BrowserPool()
+async_browser_pool = AsyncBrowserPool()
+
+# Shut the main thread's browser down cleanly at interpreter exit (sync
+# Playwright objects can only be closed from the thread that created them;
+# worker threads' drivers exit with the process)
+atexit.register(browser_pool.close)
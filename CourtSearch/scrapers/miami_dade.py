@@ -5,22 +5,93 @@ Searches the Miami-Dade Clerk OCS portal for civil/financial cases.
 Website: https://www2.miamidadeclerk.gov/ocs/
 """
 
+import copy
+import multiprocessing
+import os
 import re
+import sys
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from typing import Optional
+from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+# orjson is optional - C-speed decoding of the portal's JSON search response
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .base import (
     CountyScraper,
     SearchCriteria,
     CourtCase,
+    ResultCache,
     ScraperError,
     PLAYWRIGHT_AVAILABLE,
 )
+from .browser_pool import browser_pool
+
+
+# Result-card and field patterns, compiled once for the parse loops
+_DATE_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{2,4}")
+_DOLLAR_RE = re.compile(r"\$[\d,]+\.?\d*")
+
+# Case-type code rules, highest priority first: (group, label, tokens). A
+# code gets the label of the first rule with any token in it.
+_CASE_TYPE_RULES = (
+    ("felony", "Criminal Felony", ("CF", "CTC")),
+    ("misdemeanor", "Criminal Misdemeanor", ("CM", "MM")),
+    ("family", "Family", ("FA", "DR", "FAMILY")),
+    ("probate", "Probate", ("PR", "PROBATE")),
+    ("civil", "Civil", ("CA", "CIVIL")),
+    ("small_claims", "Small Claims", ("SC", "SMALL")),
+    ("traffic", "Traffic", ("TR", "TRAFFIC")),
+)
+
+# All rules in one pattern, as in the Broward classifier: each alternative
+# is a whole-string lookahead, so alternation order (not match position)
+# keeps the rule priority and lastgroup names the winning rule.
+_CASE_TYPE_RE = re.compile(
+    "|".join(
+        f"(?=.*?(?:{'|'.join(tokens)}))(?P<{group}>)"
+        for group, _, tokens in _CASE_TYPE_RULES
+    ),
+    re.DOTALL,
+)
+_CASE_TYPE_LABELS = {group: label for group, label, _ in _CASE_TYPE_RULES}
+
+# Card field labels (data-id values) read by _build_case. The OCS JSON API carries the same
+# fields under camelCase keys, so records are matched on the label with
+# case, spaces and punctuation stripped ("Local Case Number" ~ localCaseNumber).
+_RECORD_FIELD_LABELS = (
+    "Local Case Number",
+    "State Case Number",
+    "Filing Date",
+    "Case Status",
+    "Case Type",
+    "Section",
+    "Judge",
+    "Division",
+    "Amount",
+    "Claim Amount",
+    "Judgment Amount",
+    "Damages",
+    "Disposition Date",
+    "Closed Date",
+)
+_RECORD_FIELD_LABEL_SET = frozenset(_RECORD_FIELD_LABELS)
+_PARTY_KEYS = ("parties", "partyname", "partynames", "casestyle", "style", "title")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+
 
-if PLAYWRIGHT_AVAILABLE:
-    from playwright.sync_api import sync_playwright
+def _json_key(name: str) -> str:
+    """Normalize a field label or JSON key for matching."""
+    return _NON_ALNUM_RE.sub("", name.lower())
+
+
+_RECORD_FIELD_KEYS = tuple((label, _json_key(label)) for label in _RECORD_FIELD_LABELS)
 
 
 class MiamiDadeScraper(CountyScraper):
@@ -42,11 +113,122 @@ class MiamiDadeScraper(CountyScraper):
     BASE_URL = "https://www2.miamidadeclerk.gov"
     CIVIL_SEARCH_URL = f"{BASE_URL}/ocs/"  # Civil, Probate, Small Claims
 
+    # Portal-home links to the Party Name search, as (css, text) probes in
+    # priority order, and the same links as one selector to wait for
+    PARTY_NAV_PROBES = (
+        ("span", "Party Name"),
+        ("[role='button']", "Party Name"),
+        ("span.cursorPointer", "Party"),
+        ("a", "Party Name"),
+    )
+    PARTY_NAV_READY_SELECTOR = ", ".join(
+        f"{css}:has-text('{text}')" for css, text in PARTY_NAV_PROBES
+    )
+
+    # Rendered once the Party Name search form is usable
+    LAST_NAME_READY_SELECTOR = "#partyLastName, input[name='partyLastName'], input[name*='lastName']"
+
+    # Rendered once a search has finished: result cards, a results table,
+    # or the portal's "no results" message
+    RESULTS_READY_SELECTOR = (
+        "div[class*='TitleSearchTab'], table tr, "
+        ":text-matches('no (results|records|cases)', 'i')"
+    )
+
+    # Everything the result parsers read: the result cards and (for the
+    # generic fallback) tables. RESULTS_HTML_JS returns only the outermost
+    # matches' HTML, so scripts, header/footer and the SPA shell are never
+    # serialized, sent over the driver connection or parsed.
+    RESULTS_ROOTS_SELECTOR = "div[class*='TitleSearchTab'], table"
+    RESULTS_HTML_JS = """(selector) => {
+        const parts = [];
+        for (const el of document.querySelectorAll(selector)) {
+            const parent = el.parentElement;
+            if (!parent || !parent.closest(selector)) parts.push(el.outerHTML);
+        }
+        return parts.join("");
+    }"""
+
+    # For each probe list, the index of the first [css, text] probe with a
+    # (visible) match, or -1. text, when set, must appear in the element's
+    # text, case-insensitively.
+    FIRST_MATCH_JS = """([probeLists, requireVisible]) => {
+        const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+        const matches = ([css, text]) => {
+            let el;
+            try {
+                if (text) {
+                    const needle = text.toLowerCase();
+                    el = [...document.querySelectorAll(css)]
+                        .find(e => (e.textContent || "").toLowerCase().includes(needle));
+                } else {
+                    el = document.querySelector(css);
+                }
+            } catch (e) {
+                return false;
+            }
+            return !!el && (!requireVisible || visible(el));
+        };
+        return probeLists.map(probes => probes.findIndex(matches));
+    }"""
+
+    # Unfiltered portal results per person, shared by all instances. Court
+    # records rarely change within a day, so entries live for 24 hours.
+    _result_cache = ResultCache(maxsize=256, ttl=24 * 3600)
+
+    # Saved browser session (cookies + localStorage) reused by every search
+    # context, so a session that has already cleared the portal's CAPTCHA is
+    # not challenged again. Created interactively with login().
+    SESSION_STATE_PATH = os.path.expanduser(
+        os.environ.get("MIAMI_DADE_SESSION_PATH", "~/.cache/aichoir/miami_dade_state.json")
+    )
+
+    # Set once the portal home is found to have no server-rendered Party
+    # Name form (the normal SPA case), so the plain-HTTP fast path is only
+    # probed once per process
+    _static_form_unavailable = False
+
+    # When the home-page GET itself fails (portal down, repeated 5xx), the
+    # fast path is skipped for this many seconds instead of paying the
+    # session's retries and backoff on every search
+    STATIC_RETRY_AFTER = 600
+    _static_form_failed_at: Optional[float] = None
+
+    # How long to wait for the SPA's JSON search response before reading the
+    # rendered page instead (ms). When a search renders results without a
+    # usable JSON response, _json_response_missed_at is stamped and later
+    # searches skip the wait for JSON_RETRY_AFTER seconds.
+    JSON_RESPONSE_TIMEOUT = 4000
+    JSON_RETRY_AFTER = 600
+    _json_response_missed_at: Optional[float] = None
+
+    # Total time one browser search may take; each wait gets the smaller of
+    # its own timeout and what is left, and the search fails with
+    # ScraperError once the budget is spent
+    SEARCH_BUDGET_SECONDS = 60
+
+    # Long-lived workers for search_batch(); each keeps its pooled browser
+    # (see browser_pool.py) alive between batches
+    MAX_PARALLEL_PAGES = 3
+    _batch_executor = ThreadPoolExecutor(
+        max_workers=MAX_PARALLEL_PAGES,
+        thread_name_prefix="miami-dade-batch",
+    )
+
+    # Worker processes for search_many(), created on first use. Each process
+    # has its own browser pool, so a Chromium crash only takes down that
+    # worker, and workers are replaced after PROCESS_MAX_TASKS searches to
+    # bound memory growth.
+    PROCESS_WORKERS = 4
+    PROCESS_MAX_TASKS = 50
+    _process_pool: Optional[ProcessPoolExecutor] = None
+    _process_pool_lock = threading.Lock()
+
     @property
     def county_name(self) -> str:
         return "Miami-Dade"
 
-    def search(self, criteria: SearchCriteria) -> list[CourtCase]:
+    def search(self, criteria: SearchCriteria, use_cache: bool = True) -> list[CourtCase]:
         """
         Search Miami-Dade civil court records by party name.
 
@@ -56,8 +238,12 @@ class MiamiDadeScraper(CountyScraper):
         - Only include cases from last 5 years
         - Sort by status (Open first) then date (newest first)
 
+        Raw portal results are cached per person for 24 hours; filtering is
+        re-applied to cached results on every call.
+
         Args:
             criteria: SearchCriteria with at minimum first_name and last_name
+            use_cache: Set False to force a live portal search
 
         Returns:
             List of CourtCase objects from Miami-Dade County (filtered & sorted)
@@ -69,8 +255,139 @@ class MiamiDadeScraper(CountyScraper):
 
         # Search civil records only (no criminal - not relevant for lending)
         print("    Searching Civil court records...")
-        cases = self._search_civil_records(criteria)
+        cases = self._search_civil_records(criteria, use_cache=use_cache)
+
+        return self._finish_search(cases, criteria)
+
+    def search_batch(
+        self,
+        criteria_list: list[SearchCriteria],
+        max_concurrency: int = MAX_PARALLEL_PAGES,
+        use_cache: bool = True,
+    ) -> list[list[CourtCase]]:
+        """
+        Search several people concurrently.
+
+        The criteria are split across up to max_concurrency batch workers.
+        Each worker runs its share back-to-back on a single browser context
+        and page, so context setup and the SPA's assets are paid once per
+        worker rather than once per person. Filtering and sorting happen in
+        the calling thread as each worker finishes.
+
+        Args:
+            criteria_list: One SearchCriteria per person
+            max_concurrency: Maximum simultaneous searches (capped at MAX_PARALLEL_PAGES)
+            use_cache: Set False to force live portal searches
+
+        Returns:
+            One result list per criteria, in the same order as criteria_list
+            (empty for searches that failed)
+        """
+        results: list[list[CourtCase]] = [[] for _ in criteria_list]
+
+        if not PLAYWRIGHT_AVAILABLE:
+            print("  Error: Playwright is required for Miami-Dade searches.")
+            print("  Install with: pip install playwright && playwright install chromium")
+            return results
+
+        # Round-robin the criteria over the workers, one page per worker
+        worker_count = max(1, min(max_concurrency, self.MAX_PARALLEL_PAGES, len(criteria_list)))
+        futures = {}
+        for worker in range(worker_count):
+            indexes = list(range(worker, len(criteria_list), worker_count))
+            chunk = [criteria_list[index] for index in indexes]
+            futures[self._batch_executor.submit(self._search_civil_records_batch, chunk, use_cache)] = indexes
+
+        for future in as_completed(futures):
+            indexes = futures[future]
+            try:
+                chunk_cases = future.result()
+            except Exception as e:
+                print(f"      Batch search error: {e}")
+                continue
+            for index, cases in zip(indexes, chunk_cases):
+                criteria = criteria_list[index]
+                try:
+                    results[index] = self._finish_search(cases, criteria)
+                except Exception as e:
+                    print(f"      Batch search error for {criteria.first_name} {criteria.last_name}: {e}")
+        return results
+
+    def search_many(self, criteria_list: list[SearchCriteria], use_cache: bool = True) -> list[list[CourtCase]]:
+        """
+        Search several people in separate worker processes.
+
+        Unlike search_batch(), the Playwright work runs outside the calling
+        process entirely, so an asyncio service can await this through
+        run_in_executor() without its event loop or GIL being held by the
+        browser driver. Cached results are served in the caller; misses are
+        searched in the process pool and cached here.
+
+        Args:
+            criteria_list: One SearchCriteria per person
+            use_cache: Set False to force live portal searches
+
+        Returns:
+            One result list per criteria, in the same order as criteria_list
+            (empty for searches that failed)
+        """
+        results: list[list[CourtCase]] = [[] for _ in criteria_list]
 
+        if not PLAYWRIGHT_AVAILABLE:
+            print("  Error: Playwright is required for Miami-Dade searches.")
+            print("  Install with: pip install playwright && playwright install chromium")
+            return results
+
+        futures = {}
+        for index, criteria in enumerate(criteria_list):
+            cached = self._get_cached_cases(criteria) if use_cache else None
+            if cached is not None:
+                results[index] = self._finish_search(cached, criteria)
+            else:
+                futures[self._get_process_pool().submit(_search_in_worker, criteria)] = index
+
+        for future in as_completed(futures):
+            index = futures[future]
+            criteria = criteria_list[index]
+            try:
+                cases = future.result()
+            except Exception as e:
+                print(f"      Search error for {criteria.first_name} {criteria.last_name}: {e}")
+                continue
+            # Only cache non-empty results (see _search_civil_records_batch)
+            if cases:
+                self._result_cache.set(criteria.cache_key(), [copy.copy(case) for case in cases])
+            results[index] = self._finish_search(cases, criteria)
+        return results
+
+    @classmethod
+    def _get_process_pool(cls) -> ProcessPoolExecutor:
+        """Return the shared search_many() process pool, starting it on first use."""
+        with cls._process_pool_lock:
+            if cls._process_pool is None:
+                options = {}
+                if sys.version_info >= (3, 11):
+                    # Worker recycling needs 3.11+ and a non-fork start method
+                    options["max_tasks_per_child"] = cls.PROCESS_MAX_TASKS
+                cls._process_pool = ProcessPoolExecutor(
+                    max_workers=cls.PROCESS_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_preheat_browser,
+                    **options,
+                )
+            return cls._process_pool
+
+    def _finish_search(self, cases: list[CourtCase], criteria: SearchCriteria) -> list[CourtCase]:
+        """
+        Filter and sort raw portal results for one person.
+
+        Args:
+            cases: Unfiltered cases returned by the portal
+            criteria: Search parameters the cases were fetched for
+
+        Returns:
+            Filtered and sorted list of CourtCase objects
+        """
         # Filter and sort results for lending relevance
         filtered_cases = self._filter_and_sort_cases(cases, criteria)
 
@@ -78,21 +395,108 @@ class MiamiDadeScraper(CountyScraper):
 
         return filtered_cases
 
-    def _search_civil_records(self, criteria: SearchCriteria) -> list[CourtCase]:
+    def login(self) -> bool:
+        """
+        Interactively create the saved portal session used by every search.
+
+        Opens a visible browser on the OCS portal so an operator can sign in
+        (or register) and solve any CAPTCHA, then saves the session to
+        SESSION_STATE_PATH. Re-run when searches start hitting CAPTCHAs again
+        (the portal's cookies last about 30 days).
+
+        Returns:
+            True if the session was saved, False otherwise
+        """
+        if not PLAYWRIGHT_AVAILABLE:
+            print("  Error: Playwright is required for Miami-Dade searches.")
+            print("  Install with: pip install playwright && playwright install chromium")
+            return False
+
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=False)
+            try:
+                context = browser.new_context(user_agent=self.DEFAULT_HEADERS["User-Agent"])
+                page = context.new_page()
+                page.goto(self.CIVIL_SEARCH_URL, timeout=60000)
+
+                print("  Sign in / solve the CAPTCHA in the browser window,")
+                input("  then press Enter here to save the session...")
+
+                os.makedirs(os.path.dirname(self.SESSION_STATE_PATH), exist_ok=True)
+                context.storage_state(path=self.SESSION_STATE_PATH)
+                os.chmod(self.SESSION_STATE_PATH, 0o600)  # Session cookies are credentials
+            except Exception as e:
+                print(f"  Could not save Miami-Dade session: {e}")
+                return False
+            finally:
+                browser.close()
+
+        print(f"  Saved Miami-Dade session to {self.SESSION_STATE_PATH}")
+        return True
+
+    def _search_civil_records(self, criteria: SearchCriteria, use_cache: bool = True) -> list[CourtCase]:
         """
         Search civil and probate records via the OCS portal.
 
         Args:
             criteria: Search parameters
+            use_cache: Serve unexpired cached results for this person
 
         Returns:
             List of CourtCase objects from civil courts
         """
-        return self._search_with_playwright(
+        return self._search_civil_records_batch([criteria], use_cache)[0]
+
+    def _search_civil_records_batch(
+        self,
+        criteria_list: list[SearchCriteria],
+        use_cache: bool = True,
+    ) -> list[list[CourtCase]]:
+        """
+        Search civil and probate records for several people on one page.
+
+        People with cached results are served from the cache; the rest are
+        searched live and their non-empty results cached.
+
+        Args:
+            criteria_list: Search parameters, one per person
+            use_cache: Serve unexpired cached results
+
+        Returns:
+            One list of CourtCase objects per criteria, in order
+        """
+        results: list[Optional[list[CourtCase]]] = [
+            self._get_cached_cases(criteria) if use_cache else None
+            for criteria in criteria_list
+        ]
+        misses = [index for index, cases in enumerate(results) if cases is None]
+        if not misses:
+            return results
+
+        fetched = self._search_many_with_playwright(
             url=self.CIVIL_SEARCH_URL,
-            criteria=criteria,
+            criteria_list=[criteria_list[index] for index in misses],
             case_type_default="Civil"
         )
+        for index, cases in zip(misses, fetched):
+            # Only cache non-empty results: an empty list may be a transient
+            # CAPTCHA/timeout rather than a genuine "no records"
+            if cases:
+                self._result_cache.set(
+                    criteria_list[index].cache_key(), [copy.copy(case) for case in cases]
+                )
+            results[index] = cases
+        return results
+
+    def _get_cached_cases(self, criteria: SearchCriteria) -> Optional[list[CourtCase]]:
+        """Return copies of this person's cached raw results, or None on a miss."""
+        cached = self._result_cache.get(criteria.cache_key())
+        if cached is None:
+            return None
+        print(f"      Using cached Miami-Dade results ({len(cached)} case(s))")
+        return [copy.copy(case) for case in cached]
 
     def _search_with_playwright(
         self,
@@ -115,78 +519,272 @@ class MiamiDadeScraper(CountyScraper):
             criteria: Search parameters
             case_type_default: Default case type if not detected
 
+        Returns:
+            List of CourtCase objects
+        """
+        return self._search_many_with_playwright(url, [criteria], case_type_default)[0]
+
+    def _search_many_with_playwright(
+        self,
+        url: str,
+        criteria_list: list[SearchCriteria],
+        case_type_default: str
+    ) -> list[list[CourtCase]]:
+        """
+        Run several Party Name searches back-to-back in one browser context.
+
+        Every search re-opens the Party Name form from the portal home, so no
+        results or field values carry over between people, but the context
+        (and its cache of the SPA's scripts) and page are created only once.
+
+        Args:
+            url: URL of the search portal
+            criteria_list: Search parameters, one per person
+            case_type_default: Default case type if not detected
+
+        Returns:
+            One list of CourtCase objects per criteria, in order
+        """
+        # Plain HTTP first; only people it cannot serve need the browser
+        results = [self._search_static(url, criteria, case_type_default) for criteria in criteria_list]
+        if all(cases is not None for cases in results):
+            return results
+
+        session_state = self.SESSION_STATE_PATH if os.path.exists(self.SESSION_STATE_PATH) else None
+
+        with browser_pool.page(
+            user_agent=self.DEFAULT_HEADERS["User-Agent"],
+            storage_state=session_state,
+        ) as page:
+            timed_out = None
+            for index, criteria in enumerate(criteria_list):
+                if results[index] is None:
+                    try:
+                        results[index] = self._run_party_search(page, url, criteria, case_type_default)
+                    except ScraperError as e:
+                        print(f"      Search error: {e}")
+                        results[index] = []
+                        timed_out = e
+
+        # Surface the timeout when no search produced results, so callers
+        # can retry or degrade instead of reporting "no cases"
+        if timed_out is not None and not any(results):
+            raise timed_out
+
+        return results
+
+    def _search_static(
+        self,
+        url: str,
+        criteria: SearchCriteria,
+        case_type_default: str
+    ) -> Optional[list[CourtCase]]:
+        """
+        Try the Party Name search over plain HTTP, without a browser.
+
+        Only works when the portal serves a server-rendered Party Name form;
+        the SPA does not, in which case that is remembered and later calls
+        return immediately.
+
+        Args:
+            url: URL of the search portal
+            criteria: Search parameters
+            case_type_default: Default case type if not detected
+
+        Returns:
+            Parsed cases, or None if the browser path is needed
+        """
+        if MiamiDadeScraper._static_form_unavailable:
+            return None
+        failed_at = MiamiDadeScraper._static_form_failed_at
+        if failed_at is not None and time.monotonic() - failed_at < self.STATIC_RETRY_AFTER:
+            return None
+
+        try:
+            tree = self._get_page(url)
+        except ScraperError:
+            MiamiDadeScraper._static_form_failed_at = time.monotonic()
+            return None
+        MiamiDadeScraper._static_form_failed_at = None
+
+        forms = tree.xpath("//form[.//input[@name='partyLastName']]")
+        if not forms:
+            MiamiDadeScraper._static_form_unavailable = True
+            return None
+
+        form = forms[0]
+        data = dict(form.form_values())
+        data["partyFirstName"] = criteria.first_name
+        data["partyLastName"] = criteria.last_name
+        if criteria.middle_name and form.xpath(".//input[@name='partyMiddleName']"):
+            data["partyMiddleName"] = criteria.middle_name
+        if criteria.date_of_birth and form.xpath(".//input[@name='partyDOB']"):
+            data["partyDOB"] = criteria.date_of_birth
+
+        action = urljoin(url, form.get("action") or url)
+        try:
+            if (form.get("method") or "get").lower() == "post":
+                result_tree = self._post_page(action, data=data)
+            else:
+                result_tree = self._get_page(action, params=data)
+        except ScraperError:
+            return None
+
+        cases = self._parse_results_tree(result_tree, case_type_default)
+        return cases or None
+
+    def _run_party_search(
+        self,
+        page,
+        url: str,
+        criteria: SearchCriteria,
+        case_type_default: str
+    ) -> list[CourtCase]:
+        """
+        Open the Party Name form on an existing page, search, and parse results.
+
+        Args:
+            page: Playwright page object
+            url: URL of the search portal
+            criteria: Search parameters
+            case_type_default: Default case type if not detected
+
         Returns:
             List of CourtCase objects
         """
         cases = []
+        deadline = time.monotonic() + self.SEARCH_BUDGET_SECONDS
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent=self.DEFAULT_HEADERS["User-Agent"]
-            )
-            page = context.new_page()
+        try:
+            # Navigate to portal home and wait for the SPA's menu to render
+            page.goto(url, timeout=self._budget_ms(deadline, 60000))
 
+            # Navigate to Party Name search page
+            nav_timeout = self._budget_ms(deadline, 15000)
             try:
-                # Navigate to portal home and wait for SPA to load
-                page.goto(url, timeout=60000)
-                page.wait_for_load_state("networkidle", timeout=30000)
-                time.sleep(3)  # Allow SPA to fully initialize
-
-                # Navigate to Party Name search page
-                nav_selectors = [
-                    "span:has-text('Party Name')",
-                    "[role='button']:has-text('Party Name')",
-                    "span.cursorPointer:has-text('Party')",
-                    "a:has-text('Party Name')",
-                ]
-
-                clicked = False
-                for selector in nav_selectors:
-                    try:
-                        loc = page.locator(selector)
-                        if loc.count() > 0:
-                            loc.first.click()
-                            page.wait_for_load_state("networkidle", timeout=30000)
-                            time.sleep(3)
-                            clicked = True
-                            break
-                    except Exception:
-                        continue
+                page.wait_for_selector(self.PARTY_NAV_READY_SELECTOR, timeout=nav_timeout)
+            except Exception:
+                pass  # Fall through; the probe below reports a missing link
 
-                if not clicked:
-                    print(f"      Could not find Party Name search link at {url}")
-                    return []
+            clicked = False
+            match = self._find_first_matches(page, [self.PARTY_NAV_PROBES], require_visible=False)[0]
+            if match is not None:
+                try:
+                    self._probe_locator(page, match).click()
+                    clicked = True
+                except Exception:
+                    pass
 
-                # Now fill the search form
-                filled_form = self._fill_search_form(page, criteria)
+            if not clicked:
+                print(f"      Could not find Party Name search link at {url}")
+                return []
 
-                if not filled_form:
-                    print(f"      Could not find search form fields")
-                    return []
+            form_timeout = self._budget_ms(deadline, 15000)
+            try:
+                page.wait_for_selector(
+                    self.LAST_NAME_READY_SELECTOR, state="visible", timeout=form_timeout
+                )
+            except Exception:
+                pass  # Form fill below reports missing fields
+
+            # Now fill the search form
+            filled_form = self._fill_search_form(page, criteria)
+
+            if not filled_form:
+                print(f"      Could not find search form fields")
+                return []
+
+            # Submit the search, capturing the SPA's JSON search response so
+            # results can be read without waiting for the cards to render
+            missed_at = MiamiDadeScraper._json_response_missed_at
+            try_json = missed_at is None or time.monotonic() - missed_at >= self.JSON_RETRY_AFTER
+            if try_json:
+                response = None
+                response_timeout = self._budget_ms(deadline, self.JSON_RESPONSE_TIMEOUT)
+                try:
+                    with page.expect_response(self._is_search_response, timeout=response_timeout) as resp_info:
+                        self._submit_search(page)
+                    response = resp_info.value
+                except Exception:
+                    pass  # No matching response (URL pattern changed?) - use the DOM
 
-                # Submit the search
+                if response is not None:
+                    try:
+                        data = orjson.loads(response.body()) if ORJSON_AVAILABLE else response.json()
+                        cases = self._parse_ocs_json(data, case_type_default)
+                    except Exception:
+                        cases = []
+                if cases:
+                    MiamiDadeScraper._json_response_missed_at = None
+            else:
                 self._submit_search(page)
 
-                # Wait for results to load
-                time.sleep(4)
-                page.wait_for_load_state("networkidle", timeout=30000)
+            if not cases:
+                # Fall back to the rendered page: wait for the first result
+                # card (or a table/no-results message) instead of a fixed pause
+                results_timeout = self._budget_ms(deadline, 20000)
+                try:
+                    page.wait_for_selector(self.RESULTS_READY_SELECTOR, timeout=results_timeout)
+                except Exception:
+                    page.wait_for_load_state(
+                        "domcontentloaded", timeout=self._budget_ms(deadline, 10000)
+                    )
 
-                # Parse results from rendered page
-                content = page.content()
+                try:
+                    content = page.evaluate(self.RESULTS_HTML_JS, self.RESULTS_ROOTS_SELECTOR)
+                    content = f"<div>{content}</div>" if content else ""
+                except Exception:
+                    content = page.content()
                 cases = self._parse_spa_results(content, case_type_default)
+                if cases and try_json:
+                    # Results rendered but the JSON capture found none (pattern
+                    # mismatch or a slow response): skip the wait for a while
+                    MiamiDadeScraper._json_response_missed_at = time.monotonic()
+
+            # Only warn about CAPTCHA if no results were found
+            if not cases and self._has_captcha(page):
+                print("      Note: CAPTCHA may be blocking results")
+                print("      Consider registering at the site for unlimited searches")
+                print("      and saving the session with MiamiDadeScraper().login()")
+
+        except ScraperError:
+            raise
+        except Exception as e:
+            print(f"      Search error: {e}")
 
-                # Only warn about CAPTCHA if no results were found
-                if not cases and self._has_captcha(page):
-                    print("      Note: CAPTCHA may be blocking results")
-                    print("      Consider registering at the site for unlimited searches")
+        return cases
 
-            except Exception as e:
-                print(f"      Search error: {e}")
-            finally:
-                browser.close()
+    def _budget_ms(self, deadline: float, step_timeout: int) -> int:
+        """
+        Return a step's timeout, capped to what is left of the search budget.
 
-        return cases
+        Args:
+            deadline: time.monotonic() value the whole search must finish by
+            step_timeout: The step's own timeout in milliseconds
+
+        Returns:
+            Timeout in milliseconds for the step
+
+        Raises:
+            ScraperError: If the budget is already spent
+        """
+        remaining = int((deadline - time.monotonic()) * 1000)
+        if remaining <= 0:
+            raise ScraperError(
+                f"Miami-Dade search exceeded its {self.SEARCH_BUDGET_SECONDS}s time budget"
+            )
+        return min(step_timeout, remaining)
+
+    @staticmethod
+    def _is_search_response(response) -> bool:
+        """Match the OCS portal's JSON search API response."""
+        url = response.url.lower()
+        return (
+            response.status == 200
+            and "ocs" in url
+            and "search" in url
+            and "json" in response.headers.get("content-type", "")
+        )
 
     def _has_captcha(self, page) -> bool:
         """
@@ -198,22 +796,16 @@ class MiamiDadeScraper(CountyScraper):
         Returns:
             True if CAPTCHA is detected
         """
-        captcha_indicators = [
+        captcha_indicators = (
             "iframe[src*='recaptcha']",
             "iframe[src*='captcha']",
             ".g-recaptcha",
             "#recaptcha",
             "div[class*='captcha']",
-        ]
-
-        for selector in captcha_indicators:
-            try:
-                if page.locator(selector).count() > 0:
-                    return True
-            except Exception:
-                pass
+        )
 
-        return False
+        # Any indicator present (visible or not) counts
+        return self._find_first_matches(page, [captcha_indicators], require_visible=False)[0] is not None
 
     def _fill_search_form(self, page, criteria: SearchCriteria) -> bool:
         """
@@ -226,84 +818,61 @@ class MiamiDadeScraper(CountyScraper):
         Returns:
             True if form was successfully filled, False otherwise
         """
-        filled_first = False
-        filled_last = False
-
-        # OCS civil court form selectors
-        first_name_selectors = [
+        # OCS civil court form selectors, in priority order per field
+        first_name_selectors = (
             "#partyFirstName",
             "input[name='partyFirstName']",
             "input[name*='firstName']",
             "input[placeholder*='First']",
-        ]
-
-        last_name_selectors = [
+        )
+        last_name_selectors = (
             "#partyLastName",
             "input[name='partyLastName']",
             "input[name*='lastName']",
             "input[placeholder*='Last']",
-        ]
+        )
+        middle_selectors = (
+            "#partyMiddleName",
+            "input[name='partyMiddleName']",
+            "input[name*='middleName']",
+            "input[placeholder*='Middle']",
+        )
+        dob_selectors = (
+            "#partyDOB",
+            "input[name='partyDOB']",
+            "input[name*='DOB']",
+            "input[name*='dateOfBirth']",
+            "input[placeholder*='DOB']",
+            "input[placeholder*='Birth']",
+        )
 
-        # Fill first name
-        for selector in first_name_selectors:
-            try:
-                locator = page.locator(selector)
-                if locator.count() > 0 and locator.first.is_visible():
-                    locator.first.fill(criteria.first_name)
-                    filled_first = True
-                    break
-            except Exception:
+        # Middle name and date of birth are optional
+        fields = [
+            (first_name_selectors, criteria.first_name),
+            (last_name_selectors, criteria.last_name),
+        ]
+        if criteria.middle_name:
+            fields.append((middle_selectors, criteria.middle_name))
+        if criteria.date_of_birth:
+            fields.append((dob_selectors, criteria.date_of_birth))
+
+        # Resolve every field's selector in one round-trip, then fill
+        matches = self._find_first_matches(page, [selectors for selectors, _ in fields])
+        filled = []
+        for (selectors, value), match in zip(fields, matches):
+            if match is None:
+                filled.append(False)
                 continue
-
-        # Fill last name
-        for selector in last_name_selectors:
             try:
-                locator = page.locator(selector)
-                if locator.count() > 0 and locator.first.is_visible():
-                    locator.first.fill(criteria.last_name)
-                    filled_last = True
-                    break
+                self._probe_locator(page, match).fill(value)
+                filled.append(True)
             except Exception:
-                continue
+                filled.append(False)
 
-        # Optionally fill middle name if available
-        if criteria.middle_name:
-            middle_selectors = [
-                "#partyMiddleName",
-                "input[name='partyMiddleName']",
-                "input[name*='middleName']",
-                "input[placeholder*='Middle']",
-            ]
-            for selector in middle_selectors:
-                try:
-                    locator = page.locator(selector)
-                    if locator.count() > 0 and locator.first.is_visible():
-                        locator.first.fill(criteria.middle_name)
-                        break
-                except Exception:
-                    continue
-
-        # Optionally fill date of birth if available
-        if criteria.date_of_birth:
-            dob_selectors = [
-                "#partyDOB",
-                "input[name='partyDOB']",
-                "input[name*='DOB']",
-                "input[name*='dateOfBirth']",
-                "input[placeholder*='DOB']",
-                "input[placeholder*='Birth']",
-            ]
-            for selector in dob_selectors:
-                try:
-                    locator = page.locator(selector)
-                    if locator.count() > 0 and locator.first.is_visible():
-                        # Try different date formats
-                        locator.first.fill(criteria.date_of_birth)
-                        print(f"        Using DOB filter: {criteria.date_of_birth}")
-                        break
-                except Exception:
-                    continue
+        if criteria.date_of_birth and filled[-1]:
+            print(f"        Using DOB filter: {criteria.date_of_birth}")
 
+        filled_first, filled_last = filled[0], filled[1]
         return filled_first and filled_last
 
     def _submit_search(self, page):
@@ -315,24 +884,23 @@ class MiamiDadeScraper(CountyScraper):
         Args:
             page: Playwright page object
         """
-        submit_selectors = [
-            "button:has-text('Search')",
+        submit_selectors = (
+            ("button", "Search"),
             "button[type='submit']",
             "input[type='submit']",
-            "button:has-text('Find')",
-            "button:has-text('Submit')",
+            ("button", "Find"),
+            ("button", "Submit"),
             ".search-button",
             "#btnSearch",
-        ]
+        )
 
-        for selector in submit_selectors:
+        match = self._find_first_matches(page, [submit_selectors], require_visible=False)[0]
+        if match is not None:
             try:
-                locator = page.locator(selector)
-                if locator.count() > 0:
-                    locator.first.click()
-                    return
+                self._probe_locator(page, match).click()
+                return
             except Exception:
-                continue
+                pass
 
         # Fallback: try pressing Enter in the form
         try:
@@ -340,6 +908,52 @@ class MiamiDadeScraper(CountyScraper):
         except Exception:
             pass
 
+    def _find_first_matches(
+        self,
+        page,
+        probe_lists: list[tuple],
+        require_visible: bool = True,
+    ) -> list:
+        """
+        Resolve the first matching probe of several selector lists at once.
+
+        Probes are CSS selectors, or (css, text) tuples that additionally
+        require the element's text to contain `text` (case-insensitive, like
+        Playwright's has_text). All lists are checked in a single
+        page.evaluate call instead of count()/is_visible() per selector.
+
+        Args:
+            page: Playwright page object
+            probe_lists: One sequence of probes per element to find, in
+                priority order
+            require_visible: Only accept elements that are rendered
+
+        Returns:
+            The first matching probe of each list, or None where none matched
+        """
+        normalized = [
+            [probe if isinstance(probe, tuple) else (probe, None) for probe in probes]
+            for probes in probe_lists
+        ]
+        try:
+            indexes = page.evaluate(
+                self.FIRST_MATCH_JS,
+                [[[list(probe) for probe in probes] for probes in normalized], require_visible],
+            )
+        except Exception:
+            return [None] * len(probe_lists)
+        return [
+            probes[index] if index >= 0 else None
+            for probes, index in zip(normalized, indexes)
+        ]
+
+    def _probe_locator(self, page, probe: tuple):
+        """Build the Playwright locator for a (css, text) probe from _find_first_matches()."""
+        css, text = probe
+        if text:
+            return page.locator(css, has_text=text).first
+        return page.locator(css).first
+
     def _parse_spa_results(self, html_content: str, case_type_default: str) -> list[CourtCase]:
         """
         Parse search results from Miami-Dade OCS/CJIS rendered HTML.
@@ -350,17 +964,32 @@ class MiamiDadeScraper(CountyScraper):
         - Parties in p.m-0.fs-5.fw-bold elements
 
         Args:
-            html_content: Full HTML content of the rendered page
+            html_content: HTML of the rendered page (or just its result
+                cards and tables)
+            case_type_default: Default case type to use
+
+        Returns:
+            List of CourtCase objects extracted from the page
+        """
+        if not html_content:
+            return []
+        return self._parse_results_tree(self._parse_html(html_content), case_type_default)
+
+    def _parse_results_tree(self, tree, case_type_default: str) -> list[CourtCase]:
+        """
+        Parse result cards (or a results table) from an already parsed page.
+
+        Args:
+            tree: Parsed lxml tree of the results page
             case_type_default: Default case type to use
 
         Returns:
             List of CourtCase objects extracted from the page
         """
         cases = []
-        soup = BeautifulSoup(html_content, "lxml")
 
         # Miami-Dade specific: Find all TitleSearchTab divs (result cards)
-        result_cards = soup.find_all("div", class_=re.compile(r"TitleSearchTab"))
+        result_cards = tree.xpath("//div[contains(@class, 'TitleSearchTab')]")
 
         for card in result_cards:
             case = self._parse_miami_dade_card(card, case_type_default)
@@ -369,10 +998,60 @@ class MiamiDadeScraper(CountyScraper):
 
         # Fallback: Try generic parsing if Miami-Dade structure not found
         if not cases:
-            cases = self._parse_generic_results(soup, case_type_default)
+            cases = self._parse_generic_results(tree, case_type_default)
+
+        return cases
+
+    def _parse_ocs_json(self, data, case_type_default: str) -> list[CourtCase]:
+        """
+        Parse the OCS portal's JSON search response.
+
+        The record list is located as the first list of objects in the
+        payload (top level or nested under a wrapper key), and each record's
+        keys are matched against the card field labels.
+
+        Args:
+            data: Decoded JSON response body
+            case_type_default: Default case type to use
+
+        Returns:
+            List of CourtCase objects (empty if no records were recognized)
+        """
+        cases = []
+
+        for record in self._find_json_records(data):
+            # Scalar values only, keyed for label matching
+            values = {
+                _json_key(key): self._clean_text(str(value))
+                for key, value in record.items()
+                if isinstance(value, (str, int, float)) and not isinstance(value, bool)
+            }
+            fields = {label: values[key] for label, key in _RECORD_FIELD_KEYS if values.get(key)}
+            parties = next((values[key] for key in _PARTY_KEYS if values.get(key)), "Unknown")
+
+            case = self._build_case(
+                fields, parties, lambda: " ".join(values.values()), case_type_default
+            )
+            if case:
+                cases.append(case)
 
         return cases
 
+    @staticmethod
+    def _find_json_records(data, depth: int = 3) -> list[dict]:
+        """Return the first list of objects in a JSON payload, searching breadth-first."""
+        level = [data]
+        for _ in range(depth):
+            next_level = []
+            for node in level:
+                if isinstance(node, list):
+                    if node and isinstance(node[0], dict):
+                        return [item for item in node if isinstance(item, dict)]
+                elif isinstance(node, dict):
+                    next_level.extend(node.values())
+            level = next_level
+        return []
+
     def _parse_miami_dade_card(self, card, case_type_default: str) -> Optional[CourtCase]:
         """
         Parse a Miami-Dade OCS result card into a CourtCase object.
@@ -384,18 +1063,56 @@ class MiamiDadeScraper(CountyScraper):
         Extracts all available details including amounts, judge, division, etc.
 
         Args:
-            card: BeautifulSoup element for the result card
+            card: lxml element for the result card
             case_type_default: Default case type
 
         Returns:
             CourtCase object or None if parsing fails
         """
         try:
-            # Extract case details using data-id attributes
+            # Extract case details using data-id attributes, collected in one
+            # pass over the card (the first element wins for repeated ids).
+            # Only fields _build_case reads have their text extracted.
+            fields: dict[str, str] = {}
+            for elem in card.xpath(".//p[@data-id]"):
+                field_name = elem.get("data-id")
+                if field_name in _RECORD_FIELD_LABEL_SET and field_name not in fields:
+                    fields[field_name] = self._clean_text(elem.text_content())
+
+            # Extract parties (header of the card)
+            parties_elems = card.xpath(".//p[contains(@class, 'fw-bold')]")
+            parties = self._clean_text(parties_elems[0].text_content()) if parties_elems else "Unknown"
+
+            return self._build_case(fields, parties, card.text_content, case_type_default)
+        except Exception:
+            return None
+
+    def _build_case(
+        self,
+        fields: dict[str, str],
+        parties: str,
+        get_text,
+        case_type_default: str
+    ) -> Optional[CourtCase]:
+        """
+        Build a CourtCase from a Miami-Dade record's labelled fields.
+
+        Shared by the HTML card parser and the JSON API parser.
+
+        Args:
+            fields: Field values keyed by portal label (e.g. "Filing Date")
+            parties: Case style / party names
+            get_text: Callable returning the record's full text, used only
+                by the date/amount fallbacks
+            case_type_default: Default case type
+
+        Returns:
+            CourtCase object or None if the record has no case number
+        """
+        try:
             def get_field(field_name: str) -> str:
-                """Helper to extract field value by data-id."""
-                elem = card.find("p", {"data-id": field_name})
-                return self._clean_text(elem.get_text()) if elem else ""
+                """Helper to extract field value by label."""
+                return fields.get(field_name, "")
 
             # Get case number (prefer Local Case Number) - REQUIRED
             case_number = get_field("Local Case Number")
@@ -406,15 +1123,16 @@ class MiamiDadeScraper(CountyScraper):
             if not case_number or case_number == "Unknown":
                 return None
 
-            # Extract parties (header of the card)
-            parties_elem = card.find("p", class_=re.compile(r"fw-bold"))
-            parties = self._clean_text(parties_elem.get_text()) if parties_elem else "Unknown"
+            # Full record text for the date/amount fallbacks, built at most once
+            # and only when a fallback actually needs it
+            record_text = None
 
             # Get filing date
             filing_date = get_field("Filing Date")
             if not filing_date:
-                # Try to find any date pattern in the card
-                date_match = re.search(r"\d{1,2}/\d{1,2}/\d{2,4}", card.get_text())
+                # Try to find any date pattern in the record
+                record_text = get_text()
+                date_match = _DATE_RE.search(record_text)
                 filing_date = date_match.group() if date_match else "N/A"
 
             # Get case status
@@ -448,10 +1166,11 @@ class MiamiDadeScraper(CountyScraper):
                     amount = amt
                     break
 
-            # If no specific amount field, look for dollar signs in the card
+            # If no specific amount field, look for dollar signs in the record
             if not amount:
-                card_text = card.get_text()
-                dollar_match = re.search(r'\$[\d,]+\.?\d*', card_text)
+                if record_text is None:
+                    record_text = get_text()
+                dollar_match = _DOLLAR_RE.search(record_text)
                 if dollar_match:
                     amount = dollar_match.group()
 
@@ -507,31 +1226,15 @@ class MiamiDadeScraper(CountyScraper):
         Returns:
             Human-readable case type string
         """
-        code_upper = (case_type_code + section).upper()
-
-        if "CF" in code_upper or "CTC" in code_upper:
-            return "Criminal Felony"
-        elif "CM" in code_upper or "MM" in code_upper:
-            return "Criminal Misdemeanor"
-        elif "FA" in code_upper or "DR" in code_upper or "FAMILY" in code_upper:
-            return "Family"
-        elif "PR" in code_upper or "PROBATE" in code_upper:
-            return "Probate"
-        elif "CA" in code_upper or "CIVIL" in code_upper:
-            return "Civil"
-        elif "SC" in code_upper or "SMALL" in code_upper:
-            return "Small Claims"
-        elif "TR" in code_upper or "TRAFFIC" in code_upper:
-            return "Traffic"
-        else:
-            return default
-
-    def _parse_generic_results(self, soup: BeautifulSoup, case_type_default: str) -> list[CourtCase]:
+        match = _CASE_TYPE_RE.match((case_type_code + section).upper())
+        return _CASE_TYPE_LABELS[match.lastgroup] if match else default
+
+    def _parse_generic_results(self, tree, case_type_default: str) -> list[CourtCase]:
         """
         Fallback generic parser for non-Miami-Dade structure.
 
         Args:
-            soup: BeautifulSoup object of the page
+            tree: Parsed lxml tree of the page
             case_type_default: Default case type
 
         Returns:
@@ -540,31 +1243,30 @@ class MiamiDadeScraper(CountyScraper):
         cases = []
 
         # Try table-based results
-        for table in soup.find_all("table"):
-            rows = table.find_all("tr")[1:]  # Skip header
+        for table in tree.xpath("//table"):
+            rows = table.xpath(".//tr")[1:]  # Skip header
             for row in rows:
-                cells = row.find_all(["td", "th"])
+                cells = row.xpath(".//td | .//th")
                 if len(cells) >= 3:
-                    case = self._parse_table_row(cells, case_type_default)
+                    cell_texts = [self._clean_text(cell.text_content()) for cell in cells]
+                    case = self._parse_table_row(cell_texts, case_type_default)
                     if case:
                         cases.append(case)
 
         return cases
 
-    def _parse_table_row(self, cells: list, case_type_default: str) -> Optional[CourtCase]:
+    def _parse_table_row(self, cell_texts: list[str], case_type_default: str) -> Optional[CourtCase]:
         """
         Parse a generic table row into a CourtCase object.
 
         Args:
-            cells: List of table cell elements
+            cell_texts: Cleaned text of each table cell
             case_type_default: Default case type
 
         Returns:
             CourtCase object or None
         """
         try:
-            cell_texts = [self._clean_text(cell.get_text()) for cell in cells]
-
             if not any(cell_texts):
                 return None
 
@@ -573,7 +1275,7 @@ class MiamiDadeScraper(CountyScraper):
             # Find date
             filing_date = "N/A"
             for text in cell_texts:
-                date_match = re.search(r"\d{1,2}/\d{1,2}/\d{2,4}", text)
+                date_match = _DATE_RE.search(text)
                 if date_match:
                     filing_date = date_match.group()
                     break
@@ -597,3 +1299,16 @@ class MiamiDadeScraper(CountyScraper):
             )
         except Exception:
             return None
+
+
+def _preheat_browser() -> None:
+    """Process-pool initializer: launch this worker's browser before its first search."""
+    try:
+        browser_pool.warm()
+    except Exception:
+        pass  # The first search retries the launch and reports the error
+
+
+def _search_in_worker(criteria: SearchCriteria) -> list[CourtCase]:
+    """Process-pool task: fetch one person's raw (unfiltered) Miami-Dade cases."""
+    return MiamiDadeScraper()._search_civil_records(criteria, use_cache=False)
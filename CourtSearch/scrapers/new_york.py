@@ -7,31 +7,136 @@ Website: https://iapps.courts.state.ny.us/nyscef/
 """
 
 import asyncio
+import atexit
+import copy
+import importlib.util
+import json
+import os
 import random
 import re
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
 from typing import Optional
 
-from bs4 import BeautifulSoup
-
 from .base import (
     CountyScraper,
     SearchCriteria,
     CourtCase,
+    ResultCache,
+    PLAYWRIGHT_AVAILABLE,
 )
+from .browser_pool import async_browser_pool
 
-# Async Playwright for NY scraper (stealth mode)
-try:
-    from playwright.async_api import async_playwright
-    ASYNC_PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    ASYNC_PLAYWRIGHT_AVAILABLE = False
+# Async Playwright for NY scraper (stealth mode). Like the stealth plugin
+# below, it is only checked for here and imported on first search, so
+# loading the package never pays for it.
+ASYNC_PLAYWRIGHT_AVAILABLE = PLAYWRIGHT_AVAILABLE
 
 # Playwright stealth to bypass bot detection (Cloudflare Turnstile)
-try:
+STEALTH_AVAILABLE = importlib.util.find_spec("playwright_stealth") is not None
+
+
+@lru_cache(maxsize=None)
+def _get_stealth():
+    """Import playwright_stealth on first use and return a shared Stealth instance."""
     from playwright_stealth import Stealth
-    STEALTH_AVAILABLE = True
-except ImportError:
-    STEALTH_AVAILABLE = False
+    return Stealth()
+
+
+# Result-page and row patterns, compiled once for the parse loops
+_RESULTS_TABLE_ID_RE = re.compile(r"(?i)result|case|search")
+_RESULT_CONTAINER_CLASS_RE = re.compile(r"(?i)result|case|item")
+
+# Table-cell kinds, in priority order, as whole-string lookaheads (see
+# _CASE_TYPE_RE below): case number = 4+ digits plus a '-' or '/'
+# (NYSCEF index numbers), then a date, then a status keyword
+_CELL_KIND_RE = re.compile(
+    r"(?=.*?\d{4})(?=.*?[-/])(?P<case>)"
+    r"|(?=.*?\d{1,2}/\d{1,2}/\d{2,4})(?P<date>)"
+    r"|(?=.*?(?i:OPEN|CLOSED|ACTIVE|PENDING|DISPOSED|DECIDED))(?P<status>)",
+    re.DOTALL,
+)
+_CASE_NUMBER_RE = re.compile(r"\d{4,}[\-/]\d+")
+_DATE_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{2,4}")
+
+
+# Case-type keyword rules, highest priority first: (group, label, keywords).
+# Text gets the label of the first rule with any keyword in it.
+_CASE_TYPE_RULES = (
+    ("commercial", "Commercial", ("COMMERCIAL", "BUSINESS", "CORPORATE", "COMPANY", "LLC", "INC")),
+    ("contract", "Contract", ("CONTRACT", "BREACH", "AGREEMENT")),
+    ("insurance", "Insurance", ("INSURANCE", "INSURER", "CLAIM")),
+    ("debt", "Debt Collection", ("DEBT", "COLLECTION", "CREDITOR")),
+    ("real_estate", "Real Estate", ("REAL ESTATE", "PROPERTY", "FORECLOSURE")),
+    ("malpractice", "Professional Malpractice", ("MALPRACTICE", "PROFESSIONAL")),
+    ("civil", "Civil", ("CIVIL", "LAWSUIT", "ACTION")),
+)
+
+# All rules in one pattern, as in the Florida classifiers: each alternative
+# is a whole-string lookahead, so alternation order (not match position)
+# keeps the rule priority and lastgroup names the winning rule.
+_CASE_TYPE_RE = re.compile(
+    "|".join(
+        f"(?=.*?(?:{'|'.join(keywords)}))(?P<{group}>)"
+        for group, _, keywords in _CASE_TYPE_RULES
+    ),
+    re.DOTALL,
+)
+_CASE_TYPE_LABELS = {group: label for group, label, _ in _CASE_TYPE_RULES}
+
+
+@lru_cache(maxsize=1024)
+def _classify_ny_text(all_text: str) -> Optional[str]:
+    """Return the case-type label for upper-cased text, or None if no rule matches."""
+    match = _CASE_TYPE_RE.match(all_text)
+    return _CASE_TYPE_LABELS[match.lastgroup] if match else None
+
+
+class _LoopThread:
+    """
+    One long-lived event loop on a daemon thread, shared by every search.
+
+    Async Playwright objects belong to the loop that created them, so
+    running all searches on this loop (instead of a new asyncio.run() loop
+    each time) lets the pooled browser, its contexts and the driver
+    connection persist across searches.
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._lock = threading.Lock()
+
+    def submit(self, coro) -> Future:
+        """Schedule a coroutine on the shared loop, starting it on first use."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="new-york-loop",
+                    daemon=True,
+                ).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def shutdown(self) -> None:
+        """Close the pooled browser and stop the loop, if it was started."""
+        with self._lock:
+            loop = self._loop
+            self._loop = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(async_browser_pool.close(), loop).result(timeout=10)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+
+
+_LOOP = _LoopThread()
+atexit.register(_LOOP.shutdown)
 
 
 class NewYorkScraper(CountyScraper):
@@ -54,6 +159,15 @@ class NewYorkScraper(CountyScraper):
     BASE_URL = "https://iapps.courts.state.ny.us"
     SEARCH_URL = f"{BASE_URL}/nyscef/CaseSearch?TAB=name"
 
+    # Constant parts of each case's verification_instructions, which differ
+    # only by case number
+    _VERIFY_PREFIX = (
+        f"To verify this case manually: "
+        f"1. Visit {SEARCH_URL} "
+        f"2. Search for Case Number: "
+    )
+    _VERIFY_SUFFIX = " 3. Verify all details match your records"
+
     # Stealth mode: randomized viewports to avoid fingerprinting
     VIEWPORTS = [
         {"width": 1920, "height": 1080},
@@ -71,14 +185,117 @@ class NewYorkScraper(CountyScraper):
     ]
 
     # Retry configuration for Cloudflare bypass
-    MAX_RETRIES = 3
-    BACKOFF_TIMES = [10, 30, 90]  # seconds between retries
+    MAX_RETRIES = 4
+    BACKOFF_BASE = 5  # seconds; the backoff ceiling doubles each attempt
+    BACKOFF_CAP = 120
+
+    # Cell texts of the results table's rows (header skipped), read in the
+    # page; null when there is no results table. Mirrors the table lookup
+    # in _parse_ny_results (_RESULTS_TABLE_ID_RE).
+    RESULT_ROWS_JS = """() => {
+        const table = [...document.querySelectorAll("table[id]")]
+            .find(t => /result|case|search/i.test(t.id));
+        if (!table) return null;
+        return [...table.querySelectorAll("tr")].slice(1)
+            .map(row => [...row.querySelectorAll("td, th")].map(cell => cell.textContent));
+    }"""
+
+    # True once the submitted search has rendered a results table with data
+    # rows (the table RESULT_ROWS_JS reads) or a no-results/error message
+    RESULTS_READY_JS = """() => {
+        const table = [...document.querySelectorAll("table[id]")]
+            .find(t => /result|case|search/i.test(t.id));
+        if (table && table.querySelector("td")) return true;
+        return !!document.querySelector(".no-results, .noResults, .error, .alert")
+            || /no (matching )?(cases|records|results)/i.test(document.body.innerText);
+    }"""
+
+    # True while any Cloudflare challenge marker is on the page: the
+    # interstitial title, a Turnstile iframe/widget, or challenge body text
+    CHALLENGE_PRESENT_JS = """() => {
+        if (document.title.toLowerCase().includes("just a moment")) return true;
+        if (document.querySelector(
+            "iframe[src*='challenges.cloudflare.com'], div.cf-turnstile, div[id*='turnstile']"
+        )) return true;
+        const body = document.body ? document.body.innerText.toLowerCase() : "";
+        return body.includes("checking your browser") || body.includes("verify you are human");
+    }"""
+
+    # True once none of the Cloudflare challenge markers checked by
+    # _detect_cloudflare_challenge are left on the page
+    CHALLENGE_CLEARED_JS = """() =>
+        !document.title.toLowerCase().includes("just a moment")
+        && !document.querySelector(
+            "iframe[src*='challenges.cloudflare.com'], div.cf-turnstile, div[id*='turnstile']"
+        )"""
+
+    # NYSCEF form fields, each as one selector list covering the naming
+    # variants seen on the portal
+    FIRST_NAME_SELECTOR = ", ".join((
+        "input[name*='firstName']",
+        "input[name*='FirstName']",
+        "input[id*='firstName']",
+        "input[id*='FirstName']",
+        "input[placeholder*='first']",
+        "input[placeholder*='First']",
+        "#firstName",
+        "#txtFirstName",
+    ))
+    LAST_NAME_SELECTOR = ", ".join((
+        "input[name*='lastName']",
+        "input[name*='LastName']",
+        "input[id*='lastName']",
+        "input[id*='LastName']",
+        "input[placeholder*='last']",
+        "input[placeholder*='Last']",
+        "#lastName",
+        "#txtLastName",
+    ))
+    MIDDLE_NAME_SELECTOR = ", ".join((
+        "input[name*='middleName']",
+        "input[name*='MiddleName']",
+        "input[id*='middleName']",
+        "input[id*='MiddleName']",
+        "input[placeholder*='middle']",
+        "input[placeholder*='Middle']",
+        "#middleName",
+        "#txtMiddleName",
+    ))
+    DOB_SELECTOR = ", ".join((
+        "input[name*='DOB']",
+        "input[name*='dateOfBirth']",
+        "input[id*='DOB']",
+        "input[id*='dateOfBirth']",
+        "input[placeholder*='DOB']",
+        "input[placeholder*='birth']",
+        "input[placeholder*='Birth']",
+        "#DOB",
+        "#txtDOB",
+    ))
+
+    # Upper bound on one search_many() search, retries and backoffs included
+    SEARCH_TIMEOUT = 300
+
+    # Browser state (cookies incl. cf_clearance) saved after passing the
+    # Cloudflare check, with the fingerprint it was earned with (clearance
+    # is tied to the user agent). Reused until CLEARANCE_MAX_AGE, a little
+    # under cf_clearance's usual 30-minute lifetime.
+    CLEARANCE_STATE_PATH = os.path.expanduser(
+        os.environ.get("NYSCEF_STATE_PATH", "~/.cache/aichoir/nyscef_state.json")
+    )
+    CLEARANCE_MAX_AGE = 25 * 60
+
+    # Unfiltered NYSCEF results per person, shared by all instances. Entries
+    # are fresh for 24 hours; for up to 6 more days a stale entry is still
+    # served while a background search refreshes it.
+    _result_cache = ResultCache(maxsize=256, ttl=24 * 3600, stale_ttl=6 * 24 * 3600)
+    _refresh_tasks: dict[tuple, asyncio.Task] = {}
 
     @property
     def county_name(self) -> str:
         return "New York"
 
-    def search(self, criteria: SearchCriteria) -> list[CourtCase]:
+    def search(self, criteria: SearchCriteria, use_cache: bool = True) -> list[CourtCase]:
         """
         Search New York statewide civil court records by party name.
 
@@ -89,8 +306,13 @@ class NewYorkScraper(CountyScraper):
         - Focus on lending-relevant civil matters
         - Sort by status (Open first) then date (newest first)
 
+        Raw portal results are cached per person for 24 hours, and a stale
+        entry up to a week old is returned while it is refreshed in the
+        background; filtering is re-applied on every call.
+
         Args:
             criteria: SearchCriteria with at minimum first_name and last_name
+            use_cache: Set False to force a live portal search
 
         Returns:
             List of CourtCase objects from New York statewide (filtered & sorted)
@@ -102,8 +324,94 @@ class NewYorkScraper(CountyScraper):
 
         # Search civil records only (no criminal/family - not relevant for lending)
         print("    Searching Civil court records statewide...")
-        cases = self._search_civil_records(criteria)
+        cases = self._search_civil_records(criteria, use_cache=use_cache)
+
+        return self._finish_search(cases, criteria)
+
+    async def search_async(self, criteria: SearchCriteria, use_cache: bool = True) -> list[CourtCase]:
+        """
+        Async version of search() for callers already on an event loop.
+
+        The search itself runs on the shared scraper loop (where the pooled
+        browser lives) and is awaited from the caller's loop.
+
+        Args:
+            criteria: SearchCriteria with at minimum first_name and last_name
+            use_cache: Set False to force a live portal search
+
+        Returns:
+            List of CourtCase objects from New York statewide (filtered & sorted)
+        """
+        return await asyncio.wrap_future(_LOOP.submit(self._async_search(criteria, use_cache)))
+
+    async def _async_search(self, criteria: SearchCriteria, use_cache: bool = True) -> list[CourtCase]:
+        """search() body as a coroutine; must run on the shared loop (_LOOP)."""
+        cases = await self._async_search_civil_records(criteria, use_cache=use_cache)
+        return self._finish_search(cases, criteria)
+
+    def search_many(
+        self,
+        criteria_list: list[SearchCriteria],
+        concurrency: int = 8,
+        timeout: float = SEARCH_TIMEOUT,
+        use_cache: bool = True,
+    ) -> list[list[CourtCase]]:
+        """
+        Search several people concurrently on one event loop.
 
+        NYSCEF searches are almost entirely waits on the network, so up to
+        `concurrency` of them run at once, sharing the pooled browser.
+
+        Args:
+            criteria_list: One SearchCriteria per person
+            concurrency: Maximum simultaneous searches
+            timeout: Seconds allowed per search, retries included
+            use_cache: Set False to force live portal searches
+
+        Returns:
+            One result list per criteria, in the same order as criteria_list
+            (empty for searches that failed or timed out)
+        """
+        if not ASYNC_PLAYWRIGHT_AVAILABLE:
+            print("  Error: Playwright is required for New York searches.")
+            print("  Install with: pip install playwright && playwright install chromium")
+            return [[] for _ in criteria_list]
+
+        return _LOOP.submit(self._run_batch(criteria_list, concurrency, timeout, use_cache)).result()
+
+    async def _run_batch(
+        self,
+        criteria_list: list[SearchCriteria],
+        concurrency: int,
+        timeout: float,
+        use_cache: bool,
+    ) -> list[list[CourtCase]]:
+        """Run _async_search() for every criteria, at most `concurrency` at a time."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(criteria: SearchCriteria) -> list[CourtCase]:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(self._async_search(criteria, use_cache), timeout)
+                except asyncio.TimeoutError:
+                    print(f"      Search timed out for {criteria.first_name} {criteria.last_name}")
+                except Exception as e:
+                    print(f"      Search error for {criteria.first_name} {criteria.last_name}: {e}")
+                return []
+
+        return list(await asyncio.gather(*(bounded(criteria) for criteria in criteria_list)))
+
+    def _finish_search(self, cases: list[CourtCase], criteria: SearchCriteria) -> list[CourtCase]:
+        """
+        Filter and sort raw NYSCEF results for one person.
+
+        Args:
+            cases: Unfiltered cases returned by the portal
+            criteria: Search parameters the cases were fetched for
+
+        Returns:
+            Filtered and sorted list of CourtCase objects
+        """
         # Filter and sort results for lending relevance
         filtered_cases = self._filter_and_sort_cases(cases, criteria)
 
@@ -116,21 +424,71 @@ class NewYorkScraper(CountyScraper):
 
         return filtered_cases
 
-    def _search_civil_records(self, criteria: SearchCriteria) -> list[CourtCase]:
+    def _search_civil_records(self, criteria: SearchCriteria, use_cache: bool = True) -> list[CourtCase]:
         """
         Search civil records via the NYSCEF system statewide.
 
         Args:
             criteria: Search parameters
+            use_cache: Serve cached results when available
 
         Returns:
             List of CourtCase objects from statewide New York courts
         """
-        return self._search_with_playwright(
+        return _LOOP.submit(self._async_search_civil_records(criteria, use_cache)).result()
+
+    async def _async_search_civil_records(
+        self,
+        criteria: SearchCriteria,
+        use_cache: bool = True
+    ) -> list[CourtCase]:
+        """
+        Cache layer over the live NYSCEF search.
+
+        Fresh cached results are returned as-is. Stale ones are returned too,
+        with a background search scheduled to refresh them. Misses are
+        searched live and non-empty results cached.
+
+        Args:
+            criteria: Search parameters
+            use_cache: Serve cached results when available
+
+        Returns:
+            Unfiltered list of CourtCase objects
+        """
+        if use_cache:
+            cached, fresh = self._result_cache.get_stale(criteria.cache_key())
+            if cached is not None:
+                if fresh:
+                    print(f"      Using cached New York results ({len(cached)} case(s))")
+                else:
+                    print(f"      Using stale New York results ({len(cached)} case(s)), refreshing")
+                    self._schedule_refresh(criteria)
+                return [copy.copy(case) for case in cached]
+
+        return await self._fetch_and_cache(criteria)
+
+    async def _fetch_and_cache(self, criteria: SearchCriteria) -> list[CourtCase]:
+        """Search NYSCEF live and cache non-empty results."""
+        cases = await self._async_search_with_playwright(
             url=self.SEARCH_URL,
             criteria=criteria,
             case_type_default="Civil"
         )
+        # Only cache non-empty results: an empty list may be a Cloudflare
+        # block or timeout rather than a genuine "no records"
+        if cases:
+            self._result_cache.set(criteria.cache_key(), [copy.copy(case) for case in cases])
+        return cases
+
+    def _schedule_refresh(self, criteria: SearchCriteria) -> None:
+        """Start a background re-search for a stale entry, unless one is already running."""
+        key = criteria.cache_key()
+        if key in NewYorkScraper._refresh_tasks:
+            return
+        task = asyncio.get_running_loop().create_task(self._fetch_and_cache(criteria))
+        NewYorkScraper._refresh_tasks[key] = task
+        task.add_done_callback(lambda _: NewYorkScraper._refresh_tasks.pop(key, None))
 
     def _search_with_playwright(
         self,
@@ -141,6 +499,9 @@ class NewYorkScraper(CountyScraper):
         """
         Sync-to-async bridge for Playwright search.
 
+        Runs the search on the shared background event loop, so the pooled
+        browser stays warm between searches.
+
         Delegates to the async implementation which uses stealth mode
         and human-like behavior to bypass Cloudflare Turnstile protection.
 
@@ -152,7 +513,9 @@ class NewYorkScraper(CountyScraper):
         Returns:
             List of CourtCase objects
         """
-        return asyncio.run(self._async_search_with_playwright(url, criteria, case_type_default))
+        return _LOOP.submit(
+            self._async_search_with_playwright(url, criteria, case_type_default)
+        ).result()
 
     async def _async_search_with_playwright(
         self,
@@ -166,7 +529,10 @@ class NewYorkScraper(CountyScraper):
         Uses randomized browser fingerprints, human-like delays, and
         playwright-stealth to maximize chances of passing Cloudflare
         Turnstile challenge. Retries up to MAX_RETRIES times with
-        exponential backoff.
+        full-jitter exponential backoff. Pages come from the shared async
+        browser pool, and every attempt of a search uses the same context,
+        so a retry only opens a new page and keeps any cookies Cloudflare
+        has already set.
 
         Args:
             url: URL of the search portal
@@ -176,57 +542,73 @@ class NewYorkScraper(CountyScraper):
         Returns:
             List of CourtCase objects
         """
+        # Reuse a saved Cloudflare clearance with its fingerprint, otherwise
+        # randomize the browser fingerprint for this search
+        clearance = self._load_clearance()
+        if clearance:
+            viewport = clearance["viewport"]
+            user_agent = clearance["user_agent"]
+        else:
+            viewport = random.choice(self.VIEWPORTS)
+            user_agent = random.choice(self.USER_AGENTS)
+        # Fingerprint only: the pool caches one context per distinct options,
+        # so the (ever-changing) clearance state is added as cookies instead
+        context_options = {
+            "viewport": viewport,
+            "user_agent": user_agent,
+            "locale": "en-US",
+            "timezone_id": "America/New_York",
+            "bypass_csp": True,
+            "ignore_https_errors": True,
+        }
+
         for attempt in range(self.MAX_RETRIES):
             attempt_num = attempt + 1
             print(f"      Attempt {attempt_num}/{self.MAX_RETRIES} (stealth mode{'+ stealth plugin' if STEALTH_AVAILABLE else ''})")
 
-            browser = None
             try:
-                async with async_playwright() as p:
-                    # Randomize browser fingerprint each attempt
-                    viewport = random.choice(self.VIEWPORTS)
-                    user_agent = random.choice(self.USER_AGENTS)
-
-                    browser = await p.chromium.launch(headless=True)
-                    context = await browser.new_context(
-                        viewport=viewport,
-                        user_agent=user_agent,
-                        locale="en-US",
-                        timezone_id="America/New_York",
-                        bypass_csp=True,
-                        ignore_https_errors=True,
-                    )
-                    page = await context.new_page()
+                async with async_browser_pool.page(**context_options) as page:
+                    if clearance:
+                        # cf_clearance and friends live in the saved cookies
+                        await page.context.add_cookies(clearance["state"].get("cookies", []))
 
                     # Apply stealth patches if available
                     if STEALTH_AVAILABLE:
-                        await Stealth().apply_stealth_async(page)
+                        await _get_stealth().apply_stealth_async(page)
+
+                    # Human-like pacing is only needed while earning a
+                    # clearance; with a valid saved one it's skipped
+                    human = clearance is None
 
                     # Random pre-navigation delay (appear human)
-                    await asyncio.sleep(random.uniform(2, 5))
+                    if human:
+                        await asyncio.sleep(random.uniform(2, 5))
 
                     # Navigate to search page
                     await page.goto(url, timeout=30000)
                     await page.wait_for_load_state("domcontentloaded", timeout=15000)
 
                     # Post-navigation delay (let page settle, Cloudflare JS runs)
-                    await asyncio.sleep(random.uniform(4, 8))
+                    if human:
+                        await asyncio.sleep(random.uniform(4, 8))
 
                     # Check for Cloudflare challenge
                     if await self._detect_cloudflare_challenge(page):
+                        if clearance:
+                            self._save_clearance(None)  # Saved clearance is stale
+                            clearance = None
+                            human = True
                         print(f"      Cloudflare challenge detected, waiting for auto-solve...")
                         # Wait for Turnstile to auto-solve
-                        await asyncio.sleep(random.uniform(8, 15))
+                        await self._wait_for_challenge_to_clear(page)
 
                         # Re-check after waiting
                         if await self._detect_cloudflare_challenge(page):
                             print(f"      Still blocked by Cloudflare")
-                            await browser.close()
-                            browser = None
 
                             if attempt < self.MAX_RETRIES - 1:
-                                backoff = self.BACKOFF_TIMES[attempt]
-                                print(f"      Backing off {backoff}s before retry...")
+                                backoff = self._backoff_delay(attempt)
+                                print(f"      Backing off {backoff:.1f}s before retry...")
                                 await asyncio.sleep(backoff)
                                 continue
                             else:
@@ -236,50 +618,58 @@ class NewYorkScraper(CountyScraper):
                                 return []
 
                     print(f"      Passed Cloudflare challenge")
-
-                    # Wait for full page load
+                    if not clearance:
+                        self._save_clearance({
+                            "viewport": viewport,
+                            "user_agent": user_agent,
+                            "state": await page.context.storage_state(),
+                        })
+
+                    # Wait for the form itself rather than network quiet,
+                    # which NYSCEF's analytics beacons can hold off indefinitely
                     try:
-                        await page.wait_for_load_state("networkidle", timeout=15000)
+                        await page.wait_for_selector(
+                            self.LAST_NAME_SELECTOR, state="visible", timeout=8000
+                        )
                     except Exception:
                         pass
-                    await asyncio.sleep(random.uniform(1, 3))
 
                     # Human-like behavior before interacting with form
-                    await self._human_mouse_move(page, viewport)
-                    await self._random_scroll(page)
-                    await asyncio.sleep(random.uniform(0.5, 1.5))
+                    if human:
+                        await asyncio.sleep(random.uniform(1, 3))
+                        await self._human_mouse_move(page, viewport)
+                        await self._random_scroll(page)
+                        await asyncio.sleep(random.uniform(0.5, 1.5))
 
-                    # Fill the search form with human-like typing
-                    filled_form = await self._async_fill_ny_search_form(page, criteria)
+                    # Fill the search form (human-like typing while earning a clearance)
+                    filled_form = await self._async_fill_ny_search_form(page, criteria, human)
 
                     if not filled_form:
                         print(f"      Could not find search form fields")
                         return []
 
                     # Submit the search
-                    await self._async_submit_ny_search(page)
+                    await self._async_submit_ny_search(page, human)
 
-                    # Wait for results to load
-                    await asyncio.sleep(random.uniform(3, 5))
+                    # Wait for a results table or a no-results message
                     try:
-                        await page.wait_for_load_state("networkidle", timeout=15000)
+                        await page.wait_for_function(self.RESULTS_READY_JS, timeout=10000)
                     except Exception:
                         pass
 
-                    # Parse results from rendered page
-                    content = await page.content()
-                    cases = self._parse_ny_results(content, case_type_default)
+                    # Read the results table's cell texts in the page; only
+                    # serialize and parse the whole page if there is none
+                    rows = await page.evaluate(self.RESULT_ROWS_JS)
+                    if rows is not None:
+                        cases = self._parse_ny_rows(rows, case_type_default)
+                    else:
+                        content = await page.content()
+                        cases = self._parse_ny_results(content, case_type_default)
 
-                    await browser.close()
                     return cases
 
             except Exception as e:
                 error_msg = str(e)
-                if browser:
-                    try:
-                        await browser.close()
-                    except Exception:
-                        pass
 
                 if "timeout" in error_msg.lower():
                     print(f"      NYSCEF site unreachable (timeout)")
@@ -287,8 +677,8 @@ class NewYorkScraper(CountyScraper):
                     print(f"      Search error: {e}")
 
                 if attempt < self.MAX_RETRIES - 1:
-                    backoff = self.BACKOFF_TIMES[attempt]
-                    print(f"      Backing off {backoff}s before retry...")
+                    backoff = self._backoff_delay(attempt)
+                    print(f"      Backing off {backoff:.1f}s before retry...")
                     await asyncio.sleep(backoff)
                 else:
                     print(f"      For manual search, visit: {url}")
@@ -296,11 +686,104 @@ class NewYorkScraper(CountyScraper):
 
         return []
 
+    def _load_clearance(self) -> Optional[dict]:
+        """Read the saved Cloudflare clearance if it exists and is recent enough."""
+        try:
+            age = time.time() - os.path.getmtime(self.CLEARANCE_STATE_PATH)
+            if age > self.CLEARANCE_MAX_AGE:
+                return None
+            with open(self.CLEARANCE_STATE_PATH, encoding="utf-8") as f:
+                clearance = json.load(f)
+            if not {"viewport", "user_agent", "state"} <= clearance.keys():
+                return None
+            if not isinstance(clearance["state"], dict):
+                return None
+            return clearance
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _save_clearance(self, clearance: Optional[dict]):
+        """
+        Write (or, for None, remove) the saved Cloudflare clearance on disk.
+
+        The file is written to a temporary name and renamed into place, so
+        concurrent searches never read a partially written state.
+        """
+        path = self.CLEARANCE_STATE_PATH
+        try:
+            if clearance is None:
+                if os.path.exists(path):
+                    os.remove(path)
+                return
+
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(clearance, f)
+                os.chmod(tmp_path, 0o600)  # Cookies are credentials
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError as e:
+            print(f"      Could not save NYSCEF session: {e}")
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Seconds to wait after a failed attempt ("full jitter" backoff).
+
+        The delay is uniform between zero and an exponentially growing
+        ceiling, so concurrent searches that fail together don't all retry
+        together, and a quick recovery is usually retried sooner.
+
+        Args:
+            attempt: Zero-based index of the attempt that failed
+
+        Returns:
+            Delay in seconds
+        """
+        return random.uniform(0, min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2 ** attempt))
+
+    async def _wait_for_challenge_to_clear(self, page, timeout: int = 15000) -> None:
+        """
+        Wait until a Cloudflare challenge looks solved, for at most `timeout` ms.
+
+        Races the search form appearing against the challenge markers going
+        away and returns as soon as either happens, instead of sleeping for
+        a fixed worst-case time. The caller re-checks the page afterwards.
+
+        Args:
+            page: Async Playwright page object
+            timeout: Maximum wait in milliseconds
+        """
+        pending = {
+            asyncio.ensure_future(
+                page.wait_for_selector(self.LAST_NAME_SELECTOR, state="visible", timeout=timeout)
+            ),
+            asyncio.ensure_future(
+                page.wait_for_function(self.CHALLENGE_CLEARED_JS, timeout=timeout)
+            ),
+        }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # A wait that failed (e.g. its page context was replaced by
+                # the post-challenge navigation) doesn't end the race
+                if any(task.exception() is None for task in done):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def _detect_cloudflare_challenge(self, page) -> bool:
         """
         Check if the current page is a Cloudflare challenge/interstitial.
 
         Looks for common Cloudflare indicators:
+        - Challenge marker in the page URL
         - Page title "Just a moment"
         - Turnstile iframe or widget divs
         - "Checking your browser" body text
@@ -311,27 +794,14 @@ class NewYorkScraper(CountyScraper):
         Returns:
             True if Cloudflare challenge is detected
         """
-        try:
-            title = (await page.title()).lower()
-            if "just a moment" in title:
-                return True
-
-            # Check for Turnstile iframe
-            turnstile_iframe = page.locator("iframe[src*='challenges.cloudflare.com']")
-            if await turnstile_iframe.count() > 0:
-                return True
-
-            # Check for Turnstile widget div
-            turnstile_div = page.locator("div.cf-turnstile, div[id*='turnstile']")
-            if await turnstile_div.count() > 0:
-                return True
-
-            # Check body text for challenge indicators
-            body_text = await page.locator("body").inner_text()
-            body_lower = body_text.lower()
-            if "checking your browser" in body_lower or "verify you are human" in body_lower:
-                return True
+        # Challenge redirects carry a marker in the URL; no round trip needed
+        url = page.url
+        if "__cf_chl" in url or "/cdn-cgi/challenge" in url:
+            return True
 
+        try:
+            # All DOM checks in one evaluate instead of four separate calls
+            return bool(await page.evaluate(self.CHALLENGE_PRESENT_JS))
         except Exception:
             pass
 
@@ -374,135 +844,90 @@ class NewYorkScraper(CountyScraper):
         except Exception:
             pass
 
-    async def _human_type(self, page, selector: str, text: str) -> None:
+    async def _human_type(self, locator, text: str) -> None:
         """
         Type text with random per-character delay to simulate human typing.
 
+        Args:
+            locator: Async Playwright locator for the input field
+            text: Text to type
+        """
+        await locator.press_sequentially(text, delay=random.uniform(80, 150))
+
+    async def _fill_first_visible(self, page, selector: str, text: str, human: bool = True) -> bool:
+        """
+        Fill the first visible input matching a selector.
+
+        With human set, the field is clicked and typed into character by
+        character; otherwise the value is filled in one step.
+
         Args:
             page: Async Playwright page object
-            selector: CSS selector for the input field
+            selector: CSS selector list (comma-separated alternatives)
             text: Text to type
+            human: Click and type like a person would
+
+        Returns:
+            True if a field was found and filled
         """
-        await page.type(selector, text, delay=random.uniform(80, 150))
+        try:
+            # One query for all alternatives instead of a count() per selector
+            locator = page.locator(f"{selector} >> visible=true").first
+            if await locator.count() == 0:
+                return False
+            if human:
+                await locator.click()
+                await asyncio.sleep(random.uniform(0.3, 0.8))
+                await self._human_type(locator, text)
+            else:
+                # One value assignment + input event instead of a keystroke per character
+                await locator.fill(text)
+            return True
+        except Exception:
+            return False
 
-    async def _async_fill_ny_search_form(self, page, criteria: SearchCriteria) -> bool:
+    async def _async_fill_ny_search_form(self, page, criteria: SearchCriteria, human: bool = True) -> bool:
         """
         Fill in the NYSCEF search form with human-like typing behavior.
 
         Args:
             page: Async Playwright page object
             criteria: Search criteria to fill in
+            human: Pause between fields, like a person would
 
         Returns:
             True if form was successfully filled, False otherwise
         """
-        filled_first = False
-        filled_last = False
-
-        # NYSCEF form selectors - try various patterns
-        first_name_selectors = [
-            "input[name*='firstName']",
-            "input[name*='FirstName']",
-            "input[id*='firstName']",
-            "input[id*='FirstName']",
-            "input[placeholder*='first']",
-            "input[placeholder*='First']",
-            "#firstName",
-            "#txtFirstName",
-            "input[name='firstName']",
-        ]
-
-        last_name_selectors = [
-            "input[name*='lastName']",
-            "input[name*='LastName']",
-            "input[id*='lastName']",
-            "input[id*='LastName']",
-            "input[placeholder*='last']",
-            "input[placeholder*='Last']",
-            "#lastName",
-            "#txtLastName",
-            "input[name='lastName']",
-        ]
+        # Fields are filled one at a time: fill() types into whichever
+        # element has focus, so overlapping fills on one page can mix values
 
         # Fill first name
-        for selector in first_name_selectors:
-            try:
-                locator = page.locator(selector)
-                if await locator.count() > 0 and await locator.first.is_visible():
-                    await locator.first.click()
-                    await asyncio.sleep(random.uniform(0.3, 0.8))
-                    await self._human_type(page, selector, criteria.first_name)
-                    filled_first = True
-                    break
-            except Exception:
-                continue
+        filled_first = await self._fill_first_visible(
+            page, self.FIRST_NAME_SELECTOR, criteria.first_name, human
+        )
 
-        await asyncio.sleep(random.uniform(0.5, 1.2))
+        if human:
+            await asyncio.sleep(random.uniform(0.5, 1.2))
 
         # Fill last name
-        for selector in last_name_selectors:
-            try:
-                locator = page.locator(selector)
-                if await locator.count() > 0 and await locator.first.is_visible():
-                    await locator.first.click()
-                    await asyncio.sleep(random.uniform(0.3, 0.8))
-                    await self._human_type(page, selector, criteria.last_name)
-                    filled_last = True
-                    break
-            except Exception:
-                continue
+        filled_last = await self._fill_first_visible(
+            page, self.LAST_NAME_SELECTOR, criteria.last_name, human
+        )
 
         # Optionally fill middle name if available
         if criteria.middle_name:
-            await asyncio.sleep(random.uniform(0.3, 0.8))
-            middle_selectors = [
-                "input[name*='middleName']",
-                "input[name*='MiddleName']",
-                "input[id*='middleName']",
-                "input[id*='MiddleName']",
-                "input[placeholder*='middle']",
-                "input[placeholder*='Middle']",
-                "#middleName",
-                "#txtMiddleName",
-                "input[name='middleName']",
-            ]
-            for selector in middle_selectors:
-                try:
-                    locator = page.locator(selector)
-                    if await locator.count() > 0 and await locator.first.is_visible():
-                        await locator.first.click()
-                        await asyncio.sleep(random.uniform(0.3, 0.8))
-                        await self._human_type(page, selector, criteria.middle_name)
-                        break
-                except Exception:
-                    continue
+            if human:
+                await asyncio.sleep(random.uniform(0.3, 0.8))
+            await self._fill_first_visible(
+                page, self.MIDDLE_NAME_SELECTOR, criteria.middle_name, human
+            )
 
         # Optionally fill date of birth if available
         if criteria.date_of_birth:
-            await asyncio.sleep(random.uniform(0.3, 0.8))
-            dob_selectors = [
-                "input[name*='DOB']",
-                "input[name*='dateOfBirth']",
-                "input[id*='DOB']",
-                "input[id*='dateOfBirth']",
-                "input[placeholder*='DOB']",
-                "input[placeholder*='birth']",
-                "input[placeholder*='Birth']",
-                "#DOB",
-                "#txtDOB",
-                "input[name='DOB']",
-            ]
-            for selector in dob_selectors:
-                try:
-                    locator = page.locator(selector)
-                    if await locator.count() > 0 and await locator.first.is_visible():
-                        await locator.first.click()
-                        await asyncio.sleep(random.uniform(0.3, 0.8))
-                        await self._human_type(page, selector, criteria.date_of_birth)
-                        print(f"        Using DOB filter: {criteria.date_of_birth}")
-                        break
-                except Exception:
-                    continue
+            if human:
+                await asyncio.sleep(random.uniform(0.3, 0.8))
+            if await self._fill_first_visible(page, self.DOB_SELECTOR, criteria.date_of_birth, human):
+                print(f"        Using DOB filter: {criteria.date_of_birth}")
 
         # Try to set statewide search if available
         statewide_selectors = [
@@ -527,12 +952,13 @@ class NewYorkScraper(CountyScraper):
 
         return filled_first and filled_last
 
-    async def _async_submit_ny_search(self, page) -> None:
+    async def _async_submit_ny_search(self, page, human: bool = True) -> None:
         """
         Submit the search form with human-like behavior.
 
         Args:
             page: Async Playwright page object
+            human: Occasionally hover before clicking, like a person would
         """
         submit_selectors = [
             "button:has-text('Search')",
@@ -550,7 +976,7 @@ class NewYorkScraper(CountyScraper):
                 locator = page.locator(selector)
                 if await locator.count() > 0:
                     # Occasionally hover before clicking (human behavior)
-                    if random.random() < 0.4:
+                    if human and random.random() < 0.4:
                         await locator.first.hover()
                         await asyncio.sleep(random.uniform(0.2, 0.6))
                     await locator.first.click()
@@ -579,15 +1005,24 @@ class NewYorkScraper(CountyScraper):
             List of CourtCase objects extracted from the page
         """
         cases = []
-        soup = BeautifulSoup(html_content, "lxml")
+        if not html_content:
+            return cases
+        tree = self._parse_html(html_content)
 
         # Try to find results table
-        results_table = soup.find("table", {"id": re.compile(r"(?i)result|case|search")})
-        if results_table:
+        results_table = next(
+            (table for table in tree.xpath("//table[@id]")
+             if _RESULTS_TABLE_ID_RE.search(table.get("id"))),
+            None,
+        )
+        if results_table is not None:
             cases = self._parse_ny_table(results_table, case_type_default)
         else:
             # Look for other result containers
-            result_containers = soup.find_all("div", class_=re.compile(r"(?i)result|case|item"))
+            result_containers = [
+                div for div in tree.xpath("//div[@class]")
+                if _RESULT_CONTAINER_CLASS_RE.search(div.get("class"))
+            ]
             for container in result_containers:
                 case = self._parse_ny_container(container, case_type_default)
                 if case:
@@ -595,7 +1030,7 @@ class NewYorkScraper(CountyScraper):
 
             # If no structured results, try generic table parsing
             if not cases:
-                for table in soup.find_all("table"):
+                for table in tree.xpath("//table"):
                     table_cases = self._parse_ny_table(table, case_type_default)
                     cases.extend(table_cases)
 
@@ -606,7 +1041,24 @@ class NewYorkScraper(CountyScraper):
         Parse NYSCEF results from a table structure.
 
         Args:
-            table: BeautifulSoup table element
+            table: lxml table element
+            case_type_default: Default case type
+
+        Returns:
+            List of CourtCase objects
+        """
+        rows = table.xpath(".//tr")[1:]  # Skip header
+        return self._parse_ny_rows(
+            [[cell.text_content() for cell in row.xpath(".//td | .//th")] for row in rows],
+            case_type_default,
+        )
+
+    def _parse_ny_rows(self, rows: list[list[str]], case_type_default: str) -> list[CourtCase]:
+        """
+        Parse NYSCEF table rows given as raw cell texts (header row excluded).
+
+        Args:
+            rows: Raw text of each row's cells
             case_type_default: Default case type
 
         Returns:
@@ -614,30 +1066,27 @@ class NewYorkScraper(CountyScraper):
         """
         cases = []
 
-        rows = table.find_all("tr")[1:]  # Skip header
-        for row in rows:
-            cells = row.find_all(["td", "th"])
-            if len(cells) >= 3:
-                case = self._parse_ny_table_row(cells, case_type_default)
+        for raw_cells in rows:
+            if len(raw_cells) >= 3:
+                cell_texts = [self._clean_text(text) for text in raw_cells]
+                case = self._parse_ny_table_row(cell_texts, case_type_default)
                 if case:
                     cases.append(case)
 
         return cases
 
-    def _parse_ny_table_row(self, cells: list, case_type_default: str) -> Optional[CourtCase]:
+    def _parse_ny_table_row(self, cell_texts: list[str], case_type_default: str) -> Optional[CourtCase]:
         """
         Parse a NYSCEF table row into a CourtCase object.
 
         Args:
-            cells: List of table cell elements
+            cell_texts: Cleaned text of each table cell
             case_type_default: Default case type
 
         Returns:
             CourtCase object or None
         """
         try:
-            cell_texts = [self._clean_text(cell.get_text()) for cell in cells]
-
             if not any(cell_texts):
                 return None
 
@@ -648,15 +1097,18 @@ class NewYorkScraper(CountyScraper):
             parties = ""
             case_type = case_type_default
 
-            for i, text in enumerate(cell_texts):
-                # Look for case number patterns (NYSCEF often uses specific formats)
-                if re.search(r'\d{4,}', text) and ('-' in text or '/' in text):
+            for text in cell_texts:
+                # One match decides the cell's kind: case number (4+ digits
+                # and a '-' or '/'), else date, else status keyword
+                match = _CELL_KIND_RE.match(text)
+                if match is None:
+                    continue
+                kind = match.lastgroup
+                if kind == "case":
                     case_number = text
-                # Look for date patterns
-                elif re.search(r'\d{1,2}/\d{1,2}/\d{2,4}', text):
+                elif kind == "date":
                     filing_date = text
-                # Look for status keywords
-                elif any(word in text.upper() for word in ['OPEN', 'CLOSED', 'ACTIVE', 'PENDING', 'DISPOSED', 'DECIDED']):
+                else:
                     status = text.title()
 
             # Fallback positional parsing if pattern matching fails
@@ -676,12 +1128,7 @@ class NewYorkScraper(CountyScraper):
             case_type = self._classify_ny_case_type(case_type, parties, cell_texts)
 
             # Generate verification instructions
-            verification_instructions = (
-                f"To verify this case manually: "
-                f"1. Visit https://iapps.courts.state.ny.us/nyscef/CaseSearch?TAB=name "
-                f"2. Search for Case Number: {case_number} "
-                f"3. Verify all details match your records"
-            )
+            verification_instructions = self._VERIFY_PREFIX + case_number + self._VERIFY_SUFFIX
 
             return CourtCase(
                 case_number=case_number,
@@ -691,7 +1138,7 @@ class NewYorkScraper(CountyScraper):
                 county="New York",
                 parties=parties,
                 verification_instructions=verification_instructions,
-                search_results_url="https://iapps.courts.state.ny.us/nyscef/CaseSearch?TAB=name",
+                search_results_url=self.SEARCH_URL,
             )
         except Exception:
             return None
@@ -701,24 +1148,24 @@ class NewYorkScraper(CountyScraper):
         Parse a NYSCEF result container (fallback parsing).
 
         Args:
-            container: BeautifulSoup element containing case data
+            container: lxml element containing case data
             case_type_default: Default case type
 
         Returns:
             CourtCase object or None
         """
         try:
-            text = container.get_text()
+            text = container.text_content()
 
             # Extract case number
-            case_number_match = re.search(r'\d{4,}[\-/]\d+', text)
+            case_number_match = _CASE_NUMBER_RE.search(text)
             case_number = case_number_match.group() if case_number_match else ""
 
             if not case_number:
                 return None
 
             # Extract date
-            date_match = re.search(r'\d{1,2}/\d{1,2}/\d{2,4}', text)
+            date_match = _DATE_RE.search(text)
             filing_date = date_match.group() if date_match else "N/A"
 
             # Extract status
@@ -733,12 +1180,7 @@ class NewYorkScraper(CountyScraper):
             case_type = self._classify_ny_case_type(case_type_default, text, [])
 
             # Generate verification instructions
-            verification_instructions = (
-                f"To verify this case manually: "
-                f"1. Visit https://iapps.courts.state.ny.us/nyscef/CaseSearch?TAB=name "
-                f"2. Search for Case Number: {case_number} "
-                f"3. Verify all details match your records"
-            )
+            verification_instructions = self._VERIFY_PREFIX + case_number + self._VERIFY_SUFFIX
 
             return CourtCase(
                 case_number=case_number,
@@ -748,7 +1190,7 @@ class NewYorkScraper(CountyScraper):
                 county="New York",
                 parties="See case details",
                 verification_instructions=verification_instructions,
-                search_results_url="https://iapps.courts.state.ny.us/nyscef/CaseSearch?TAB=name",
+                search_results_url=self.SEARCH_URL,
             )
         except Exception:
             return None
@@ -774,32 +1216,4 @@ class NewYorkScraper(CountyScraper):
         # Combine all available text for analysis
         all_text = f"{current_type} {parties} {' '.join(cell_texts)}".upper()
 
-        # Commercial/Business litigation
-        if any(term in all_text for term in ['COMMERCIAL', 'BUSINESS', 'CORPORATE', 'COMPANY', 'LLC', 'INC']):
-            return "Commercial"
-
-        # Contract disputes
-        elif any(term in all_text for term in ['CONTRACT', 'BREACH', 'AGREEMENT']):
-            return "Contract"
-
-        # Insurance matters
-        elif any(term in all_text for term in ['INSURANCE', 'INSURER', 'CLAIM']):
-            return "Insurance"
-
-        # Debt collection
-        elif any(term in all_text for term in ['DEBT', 'COLLECTION', 'CREDITOR']):
-            return "Debt Collection"
-
-        # Real estate
-        elif any(term in all_text for term in ['REAL ESTATE', 'PROPERTY', 'FORECLOSURE']):
-            return "Real Estate"
-
-        # Professional malpractice
-        elif any(term in all_text for term in ['MALPRACTICE', 'PROFESSIONAL']):
-            return "Professional Malpractice"
-
-        # Default to Civil if not classified
-        elif current_type == "Civil" or any(term in all_text for term in ['CIVIL', 'LAWSUIT', 'ACTION']):
-            return "Civil"
-
-        return current_type
+        return _classify_ny_text(all_text) or current_type
@@ -1,75 +1,265 @@
+import gzip
+import json
 import os
 import sys
+import threading
 import time
 import uuid
-import threading
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from flask import Flask, request, jsonify, send_from_directory
+from itertools import chain
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
 from flask_cors import CORS
 
 # Import CourtSearch scrapers from sibling directory
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'CourtSearch'))
-from scrapers import SearchCriteria, search_court_records, get_api_response, get_scraper
+from scrapers import SearchCriteria, search_court_records, get_api_response_bytes, get_scraper
+from scrapers.base import ResultCache
+from case_index import CaseIndex
 
 # Resolve the dist directory (built React frontend)
 DIST_DIR = os.path.join(os.path.dirname(__file__), '..', 'dist')
+ASSET_MAX_AGE = 365 * 24 * 3600  # Hashed build assets never change in place
+GZIP_MIN_SIZE = 1024  # Smaller results aren't worth compressing
 
-app = Flask(__name__, static_folder=DIST_DIR, static_url_path='')
+# In production nginx serves dist/ itself (see architectureplan.md); Flask's
+# own serving, all through serve() below, remains for local runs and
+# single-process deploys
+app = Flask(__name__, static_folder=None)
 CORS(app)
 
-# In-memory job store: { job_id: { status, message, result, error } }
-jobs = {}
+# redis is optional - with REDIS_URL set, jobs are kept in Redis so that any
+# worker process can answer /api/status and /api/results for them
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+REDIS_URL = os.environ.get('REDIS_URL')
+JOB_TTL = 3600  # Seconds a job stays readable
+
+
+class MemoryJobStore:
+    """
+    Per-process job store: { job_id: { status, message, result, error } },
+    where result is the encoded JSON response body.
+
+    Jobs are dropped JOB_TTL seconds after creation, and the oldest ones
+    once more than maxsize are held, so results don't accumulate forever.
+    """
+
+    def __init__(self, maxsize=10000, ttl=JOB_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._jobs = OrderedDict()  # job_id -> (expires_at, fields), oldest first
+        self._changed = threading.Condition()
+
+    def create(self, job_id, **fields):
+        with self._changed:
+            now = time.monotonic()
+            while self._jobs and (
+                len(self._jobs) >= self.maxsize or next(iter(self._jobs.values()))[0] < now
+            ):
+                self._jobs.popitem(last=False)
+            self._jobs[job_id] = (now + self.ttl, fields)
+
+    def update(self, job_id, **fields):
+        with self._changed:
+            entry = self._jobs.get(job_id)
+            if entry is None:
+                return  # Evicted while still running; nobody can read it anyway
+            entry[1].update(fields)
+            self._changed.notify_all()
+
+    def get(self, job_id):
+        with self._changed:
+            entry = self._jobs.get(job_id)
+            if entry is None or entry[0] < time.monotonic():
+                return None
+            return dict(entry[1])
+
+    def wait(self, job_id, timeout):
+        """Block until some job is updated or timeout seconds pass."""
+        with self._changed:
+            self._changed.wait(timeout)
+
+
+class RedisJobStore:
+    """Job store shared across processes: one hash per job, expiring after JOB_TTL."""
+
+    def __init__(self, url):
+        self._redis = redis.Redis.from_url(url, decode_responses=True)
+
+    @staticmethod
+    def _encode(fields):
+        # Hash values must be strings: the JSON result bytes are stored as
+        # text, None as ''
+        return {
+            key: value.decode('utf-8') if key == 'result' and value else (value or '')
+            for key, value in fields.items()
+        }
+
+    def create(self, job_id, **fields):
+        key = f'job:{job_id}'
+        pipe = self._redis.pipeline()
+        pipe.hset(key, mapping=self._encode(fields))
+        pipe.expire(key, JOB_TTL)
+        pipe.execute()
+
+    def update(self, job_id, **fields):
+        # Re-arm the expiry so a write after it lapsed can't leave a
+        # hash behind with no TTL
+        key = f'job:{job_id}'
+        pipe = self._redis.pipeline()
+        pipe.hset(key, mapping=self._encode(fields))
+        pipe.expire(key, JOB_TTL)
+        pipe.execute()
+
+    def wait(self, job_id, timeout):
+        """Pause before the next read; Redis hashes have no change signal."""
+        time.sleep(min(timeout, 0.5))
+
+    def get(self, job_id):
+        job = self._redis.hgetall(f'job:{job_id}')
+        if not job:
+            return None
+        job['result'] = job['result'].encode('utf-8') if job.get('result') else None
+        job['error'] = job.get('error') or None
+        return job
+
+
+jobs = RedisJobStore(REDIS_URL) if REDIS_AVAILABLE and REDIS_URL else MemoryJobStore()
 
-
-OPEN_STATUSES = {'open', 'active', 'pending'}
 COUNTIES = ['miami-dade', 'broward']
 
+# Built at import so the first search doesn't pay for scraper construction
+# (get_scraper() shares one instance per county, along with its session)
+SCRAPERS = {county: get_scraper(county) for county in COUNTIES}
+
+# Long-lived county workers: scrapers keep one pooled Chromium per thread, so
+# reusing threads across jobs avoids relaunching the browser for every search.
+search_executor = ThreadPoolExecutor(max_workers=len(COUNTIES) * 2)
+
+# Runs run_search for each job on a reused thread instead of starting a new
+# one per request; the county work itself happens on search_executor
+job_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='search-job')
+
+# Jobs accepted but not yet finished (running plus waiting for a worker);
+# beyond this /api/search answers 503 instead of growing the backlog
+MAX_PENDING_JOBS = 100
+job_slots = threading.BoundedSemaphore(MAX_PENDING_JOBS)
+
+# Encoded API responses keyed by SearchCriteria.cache_key(), so repeat
+# searches for the same person within the TTL skip scraping entirely
+result_cache = ResultCache(maxsize=1024, ttl=900)
+
+# Open cases per searched person on disk, reused for a day across restarts
+case_index = CaseIndex()
+
+
+def scrape_counties(job_id, criteria):
+    """
+    Search every county in parallel, reporting progress on the job.
+
+    Returns:
+        (cases, complete): the cases found, deduplicated by county and case
+        number, and whether every county returned cases. A county that
+        raised or came back empty counts as incomplete: scrapers report
+        login/form/CAPTCHA trouble as no results, so an empty county can't
+        be told apart from a failed one
+    """
+    # One result list per county, flattened once at the end
+    per_county = []
+    complete = True
+    jobs.update(job_id, message='Searching all counties...')
+
+    futures = {search_executor.submit(SCRAPERS[c].search, criteria): c for c in COUNTIES}
+    for done, future in enumerate(as_completed(futures), 1):
+        county = futures[future]
+        try:
+            cases = future.result()
+            per_county.append(cases)
+            if not cases:
+                complete = False
+        except Exception as e:
+            print(f'[Search] {county} failed: {e}')
+            complete = False
+        # Only this thread writes the job, so no lock is needed
+        jobs.update(job_id, message=f'Searched {done} of {len(COUNTIES)} counties...')
+
+    # Drop repeats (e.g. a case listed under two party searches)
+    all_cases = []
+    seen = set()  # (county, case_number) of every case kept so far
+    for case in chain.from_iterable(per_county):
+        key = (case.county, case.case_number)
+        if key not in seen:
+            seen.add(key)
+            all_cases.append(case)
+
+    return all_cases, complete
+
 
 def run_search(job_id, criteria):
     """Run court search in background thread and update job store."""
     start_time = time.time()
     try:
-        jobs[job_id]['status'] = 'running'
-
-        # Search Florida counties in parallel
-        all_cases = []
-        jobs[job_id]['message'] = 'Searching all counties...'
-
-        def search_county(county):
-            scraper = get_scraper(county)
-            return scraper.search(criteria)
-
-        with ThreadPoolExecutor(max_workers=len(COUNTIES)) as executor:
-            futures = {executor.submit(search_county, c): c for c in COUNTIES}
-            for future in as_completed(futures):
-                county = futures[future]
-                try:
-                    cases = future.result()
-                    all_cases.extend(cases)
-                except Exception as e:
-                    print(f'[Search] {county} failed: {e}')
-
-        # Filter out closed cases — only keep open/active/pending
-        open_cases = [c for c in all_cases if c.status.lower() in OPEN_STATUSES]
-
-        jobs[job_id]['message'] = 'Compiling results...'
-        result = get_api_response(open_cases, criteria)
-
-        jobs[job_id]['result'] = result
-        jobs[job_id]['status'] = 'complete'
-        jobs[job_id]['message'] = 'Search complete'
-
-        elapsed = time.time() - start_time
-        print(f'[Search] {criteria.first_name} {criteria.last_name} — '
-              f'{len(open_cases)} open cases (of {len(all_cases)} total) — '
-              f'{elapsed:.1f}s')
+        jobs.update(job_id, status='running')
+
+        # A person searched within the last day is answered from the case
+        # index, which already holds just their open cases
+        indexed = case_index.lookup_open(criteria)
+        if indexed is not None:
+            all_cases = open_cases = indexed
+            complete = True
+        else:
+            # Search Florida counties in parallel
+            all_cases, complete = scrape_counties(job_id, criteria)
+
+            # Filter out closed cases — only keep open/active/pending
+            # (is_open is derived from status once, when each CourtCase is built)
+            open_cases = [c for c in all_cases if c.is_open]
+
+            if complete:
+                case_index.store(criteria, all_cases)
+
+        jobs.update(job_id, message='Compiling results...')
+        # Encoded once here (orjson when installed); every results fetch
+        # then sends these bytes as-is
+        result = get_api_response_bytes(open_cases, criteria)
+        if complete:
+            # Empty or partial results may hide a failed county; never repeat them
+            result_cache.set(criteria.cache_key(), result)
+
+        jobs.update(job_id, result=result, status='complete', message='Search complete')
+
+        # One JSON object per line so log pipelines can aggregate timings;
+        # total_cases only counts open cases when served from the index
+        print(json.dumps({
+            'event': 'search',
+            'name': f'{criteria.first_name} {criteria.last_name}',
+            'source': 'index' if indexed is not None else 'scrape',
+            'open_cases': len(open_cases),
+            'total_cases': len(all_cases),
+            'complete': complete,
+            'elapsed_s': round(time.time() - start_time, 2),
+        }), flush=True)
     except Exception as e:
-        elapsed = time.time() - start_time
-        print(f'[Search] {criteria.first_name} {criteria.last_name} — '
-              f'ERROR after {elapsed:.1f}s: {e}')
-        jobs[job_id]['status'] = 'error'
-        jobs[job_id]['error'] = str(e)
-        jobs[job_id]['message'] = f'Error: {str(e)}'
+        print(json.dumps({
+            'event': 'search_error',
+            'name': f'{criteria.first_name} {criteria.last_name}',
+            'error': str(e),
+            'elapsed_s': round(time.time() - start_time, 2),
+        }), flush=True)
+        jobs.update(job_id, status='error', error=str(e), message=f'Error: {str(e)}')
+
+
+def run_queued_search(job_id, criteria):
+    """Run a job taken from job_executor's queue and free its slot afterwards."""
+    try:
+        run_search(job_id, criteria)
+    finally:
+        job_slots.release()
 
 
 @app.route('/api/search', methods=['POST'])
@@ -96,15 +286,20 @@ def start_search():
     )
 
     job_id = str(uuid.uuid4())
-    jobs[job_id] = {
-        'status': 'running',
-        'message': 'Starting search...',
-        'result': None,
-        'error': None,
-    }
 
-    thread = threading.Thread(target=run_search, args=(job_id, criteria), daemon=True)
-    thread.start()
+    cached = result_cache.get(criteria.cache_key())
+    if cached is not None:
+        jobs.create(job_id, status='complete', message='Search complete', result=cached, error=None)
+        return jsonify({'job_id': job_id}), 202
+
+    if not job_slots.acquire(blocking=False):
+        response = jsonify({'error': 'Too many searches in progress, please try again shortly'})
+        response.headers['Retry-After'] = '30'
+        return response, 503
+
+    jobs.create(job_id, status='running', message='Starting search...', result=None, error=None)
+
+    job_executor.submit(run_queued_search, job_id, criteria)
 
     return jsonify({'job_id': job_id}), 202
 
@@ -121,6 +316,40 @@ def get_status(job_id):
     })
 
 
+@app.route('/api/events/<job_id>', methods=['GET'])
+def stream_status(job_id):
+    """Push the job's status/message as Server-Sent Events until it finishes."""
+    if not jobs.get(job_id):
+        return jsonify({'error': 'Job not found'}), 404
+
+    def events():
+        last = None
+        last_sent = 0.0
+        while True:
+            job = jobs.get(job_id)
+            if job is None:
+                return
+            current = (job['status'], job['message'])
+            if current != last:
+                last = current
+                payload = json.dumps({'status': current[0], 'message': current[1]})
+                yield f'data: {payload}\n\n'
+                last_sent = time.monotonic()
+            elif time.monotonic() - last_sent >= 15:
+                # Comment line so proxies don't drop an idle connection
+                yield ': keep-alive\n\n'
+                last_sent = time.monotonic()
+            if current[0] in ('complete', 'error'):
+                return
+            jobs.wait(job_id, timeout=15)
+
+    return Response(
+        stream_with_context(events()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
 @app.route('/api/results/<job_id>', methods=['GET'])
 def get_results(job_id):
     job = jobs.get(job_id)
@@ -130,7 +359,14 @@ def get_results(job_id):
     if job['status'] != 'complete':
         return jsonify({'error': 'Results not ready', 'status': job['status']}), 400
 
-    return jsonify(job['result'])
+    body = job['result']
+    response = Response(body, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    # Case lists are repetitive JSON and shrink several-fold under gzip
+    if len(body) >= GZIP_MIN_SIZE and 'gzip' in request.accept_encodings:
+        response.set_data(gzip.compress(body, compresslevel=6))
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
 
 
 # Serve React frontend (production)
@@ -138,6 +374,12 @@ def get_results(job_id):
 @app.route('/<path:path>')
 def serve(path):
     if path and os.path.exists(os.path.join(DIST_DIR, path)):
+        if path.startswith('assets/'):
+            # Vite puts a content hash in every asset filename, so browsers
+            # can keep them for good; index.html stays revalidated
+            response = send_from_directory(DIST_DIR, path, max_age=ASSET_MAX_AGE)
+            response.cache_control.immutable = True
+            return response
         return send_from_directory(DIST_DIR, path)
     return send_from_directory(DIST_DIR, 'index.html')
 
@@ -0,0 +1,127 @@
+"""
+Persistent SQLite index of scraped cases, keyed by the person searched.
+
+Each completed search records its normalized name/DOB key in `searches` and
+every case it found in `cases`, indexed by that key and by is_open. A repeat
+search within INDEX_TTL then reads the person's open cases straight from
+disk (surviving restarts) instead of scraping and filtering them again.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import fields
+
+from scrapers import CourtCase
+
+INDEX_PATH = os.environ.get(
+    'CASE_INDEX_PATH',
+    os.path.join(os.path.expanduser('~'), '.cache', 'aichoir', 'case_index.sqlite3'),
+)
+INDEX_TTL = 24 * 3600  # Seconds an indexed search is served without re-scraping
+
+# CourtCase constructor fields; derived ones (is_open, filing_ts) are rebuilt
+_CASE_FIELDS = tuple(f.name for f in fields(CourtCase) if f.init)
+
+# Bumped whenever the tables change; an older index is dropped and rebuilt
+# (it only ever holds re-scrapeable data)
+SCHEMA_VERSION = 2
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS searches (
+    first TEXT NOT NULL,
+    last TEXT NOT NULL,
+    middle TEXT NOT NULL,
+    dob TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (last, first, middle, dob)
+);
+CREATE TABLE IF NOT EXISTS cases (
+    first TEXT NOT NULL,
+    last TEXT NOT NULL,
+    middle TEXT NOT NULL,
+    dob TEXT NOT NULL,
+    county TEXT NOT NULL,
+    case_number TEXT NOT NULL,
+    is_open INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (last, first, middle, dob, county, case_number)
+);
+CREATE INDEX IF NOT EXISTS cases_open ON cases (last, first, middle, dob, is_open);
+'''
+
+
+class CaseIndex:
+    """Thread-safe SQLite case index (one connection per thread)."""
+
+    def __init__(self, path=INDEX_PATH, ttl=INDEX_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._connect() as conn:
+            if conn.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+                conn.executescript('DROP TABLE IF EXISTS cases; DROP TABLE IF EXISTS searches;')
+                conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    def lookup_open(self, criteria):
+        """
+        Return the person's indexed open cases, or None if not indexed recently.
+
+        Args:
+            criteria: SearchCriteria identifying the person
+
+        Returns:
+            List of open CourtCase objects (possibly empty), or None on a miss
+        """
+        key = criteria.cache_key()
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT fetched_at FROM searches WHERE first=? AND last=? AND middle=? AND dob=?',
+            key,
+        ).fetchone()
+        if row is None or row[0] < time.time() - self.ttl:
+            return None
+        rows = conn.execute(
+            'SELECT data FROM cases WHERE first=? AND last=? AND middle=? AND dob=? AND is_open=1 '
+            'ORDER BY position',
+            key,
+        ).fetchall()
+        return [CourtCase(**json.loads(data)) for data, in rows]
+
+    def store(self, criteria, cases):
+        """
+        Replace the person's indexed cases with a fresh search's results.
+
+        Args:
+            criteria: SearchCriteria identifying the person
+            cases: Every (deduplicated) CourtCase the search found, in the
+                order lookups should return them
+        """
+        key = criteria.cache_key()
+        rows = [
+            key + (
+                case.county,
+                case.case_number,
+                int(case.is_open),
+                position,
+                json.dumps({name: getattr(case, name) for name in _CASE_FIELDS}),
+            )
+            for position, case in enumerate(cases)
+        ]
+        with self._connect() as conn:
+            conn.execute('DELETE FROM cases WHERE first=? AND last=? AND middle=? AND dob=?', key)
+            conn.executemany('INSERT OR REPLACE INTO cases VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            conn.execute('INSERT OR REPLACE INTO searches VALUES (?, ?, ?, ?, ?)', key + (time.time(),))
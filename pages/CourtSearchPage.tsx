@@ -94,7 +94,7 @@ const CourtSearchPage: React.FC = () => {
   const rotationRef = useRef<number>(0);
   const modeRef = useRef<'idle' | 'loading' | 'done'>('idle');
   const timeRef = useRef<number>(0);
-  const pollRef = useRef<ReturnType<typeof setInterval> | null>(null);
+  const eventsRef = useRef<EventSource | null>(null);
 
   const [firstName, setFirstName] = useState('');
   const [lastName, setLastName] = useState('');
@@ -123,7 +123,7 @@ const CourtSearchPage: React.FC = () => {
 
     return () => {
       cancelAnimationFrame(animFrameRef.current);
-      if (pollRef.current) clearInterval(pollRef.current);
+      eventsRef.current?.close();
     };
   }, []);
 
@@ -314,35 +314,45 @@ const CourtSearchPage: React.FC = () => {
 
       const { job_id } = await res.json();
 
-      // Poll for status every 3 seconds
-      pollRef.current = setInterval(async () => {
-        try {
-          const statusRes = await fetch(`/api/status/${job_id}`);
-          const statusData = await statusRes.json();
+      // Status updates are pushed over Server-Sent Events
+      const events = new EventSource(`/api/events/${job_id}`);
+      eventsRef.current = events;
 
-          if (statusData.message) {
-            setStatusText(statusData.message);
-          }
+      const stopEvents = () => {
+        events.close();
+        if (eventsRef.current === events) eventsRef.current = null;
+      };
+
+      events.onmessage = async (event) => {
+        const statusData = JSON.parse(event.data);
 
-          if (statusData.status === 'complete') {
-            if (pollRef.current) clearInterval(pollRef.current);
-            pollRef.current = null;
+        if (statusData.message) {
+          setStatusText(statusData.message);
+        }
 
+        if (statusData.status === 'complete') {
+          stopEvents();
+          try {
             // Fetch full results
             const resultsRes = await fetch(`/api/results/${job_id}`);
             const resultsData = await resultsRes.json();
             showCompletion(resultsData, null);
-          } else if (statusData.status === 'error') {
-            if (pollRef.current) clearInterval(pollRef.current);
-            pollRef.current = null;
-            showCompletion(null, statusData.message || 'Search failed');
+          } catch {
+            showCompletion(null, 'Lost connection to server');
           }
-        } catch {
-          if (pollRef.current) clearInterval(pollRef.current);
-          pollRef.current = null;
-          showCompletion(null, 'Lost connection to server');
+        } else if (statusData.status === 'error') {
+          stopEvents();
+          showCompletion(null, statusData.message || 'Search failed');
         }
-      }, 3000);
+      };
+
+      events.onerror = () => {
+        // The server closes the stream after the final event; only an
+        // error while the stream is still ours means the connection dropped
+        if (eventsRef.current !== events) return;
+        stopEvents();
+        showCompletion(null, 'Lost connection to server');
+      };
     } catch {
       showCompletion(null, 'Could not connect to server');
     }
@@ -357,9 +367,9 @@ const CourtSearchPage: React.FC = () => {
     setSearchError(null);
     rotationRef.current = 0;
 
-    if (pollRef.current) {
-      clearInterval(pollRef.current);
-      pollRef.current = null;
+    if (eventsRef.current) {
+      eventsRef.current.close();
+      eventsRef.current = null;
     }
 
     const { w, h } = canvasSizeRef.current;